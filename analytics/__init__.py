@@ -0,0 +1,30 @@
+"""
+Git analytics behind the paper's metrics, figures and slides.
+
+Every generator is a module with a main(argv=None) entry point, runnable as
+`python3 -m analytics.<module>` from the repo root or through the wrappers
+in scripts/ and visualizations/. Importing the package or a module is cheap:
+pandas and matplotlib are imported only on the paths that draw or build
+DataFrames, so metrics-only runs never load them.
+
+  metrics        metrics.tex from live git and GitHub data
+  charts         git history charts and stats.json
+  theseus        git-of-theseus code age plots
+  code_age       incremental code-age series (theseus JSON) with checkpoints
+  survival       Kaplan-Meier line survival from birth/death/censoring events
+  json_stream    incremental JSON reader for large theseus inputs
+  downsample     LTTB and peak-preserving downsampling before plotting
+  slides         training slide deck (python-pptx)
+  aggregates     per-repo and ecosystem totals shared by metrics and charts
+  dataset        shared DataFrames for the charts
+  repos          repo discovery from the repos.json manifest
+  prepare        optional commit-graph + Bloom filter preparation
+  figures        figure style, output profiles and skip-if-unchanged cache
+  git_history    cached git history extraction
+  file_index     per-repo file/language index
+  loc            blob line counts via git cat-file --batch
+  github_issues  batched GitHub issue counts
+  repo_pool      bounded per-repo worker pool
+  tracing        optional Chrome-trace spans
+  benchmark      pipeline benchmark on synthetic repos
+"""
@@ -0,0 +1,185 @@
+"""
+Per-repo and ecosystem aggregates behind metrics.tex and stats.json.
+
+One build collects commits, merges, tags, LOC (total and per language),
+languages and first/last commit dates for every repo, derives the ecosystem
+and measured-set totals from them, and persists the result as a versioned
+artifact (.cache/aggregates.json). metrics.py and charts.py both read their
+numbers from it, so the paper and the charts cannot disagree.
+
+Each repo entry records the ref fingerprint it was computed from (see
+git_history.py). Loading the artifact costs one for-each-ref per repo;
+only repos whose refs moved are collected again, so the second generator
+in a build does no further git work.
+
+Commits are every commit reachable from any ref, merges included (the
+`git rev-list --all --count` definition the paper uses).
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime, timezone
+
+from . import tracing
+from .file_index import PROGRAMMING_LANGS, file_index
+from .git_history import CACHE_DIR, load_history, ref_fingerprint
+from .loc import save_blob_cache
+from .prepare import prepare_repos
+from .repo_pool import git, map_repos
+from .repos import load_repos, measured_repos, present_repos
+from .tracing import span
+
+AGGREGATES_PATH = CACHE_DIR / 'aggregates.json'
+
+# Bump when a recorded field or the way it is computed changes
+AGGREGATES_VERSION = 1
+
+
+def count_tags(repo_path):
+    """Count tags in a repo."""
+    r = git(repo_path, 'tag', '-l')
+    return len(r.stdout.strip().split('\n')) if r.stdout.strip() else 0
+
+
+def first_last_commit(history):
+    """First and last commit dates (UTC, ISO 8601) from commit timestamps."""
+    times = history.commits.time
+    if not times:
+        return '', ''
+    return (datetime.fromtimestamp(min(times), timezone.utc).isoformat(),
+            datetime.fromtimestamp(max(times), timezone.utc).isoformat())
+
+
+def collect_repo(name, path):
+    """Commit, tag, LOC and date aggregates for one repo."""
+    history = load_history(path)
+    index = file_index(path)
+    first, last = first_last_commit(history)
+    return {
+        'path': str(path), 'fingerprint': history.fingerprint,
+        'commits': len(history.commits), 'merges': sum(history.commits.merge),
+        'tags': count_tags(path), 'loc': index.loc(),
+        'loc_by_lang': index.loc_by_language(), 'languages': sorted(index.languages()),
+        'first': first, 'last': last,
+    }
+
+
+def summarize(per_repo):
+    """Ecosystem and measured-set totals over the per-repo aggregates."""
+    firsts = [d['first'] for d in per_repo.values() if d['first']]
+    lasts = [d['last'] for d in per_repo.values() if d['last']]
+    ecosystem = {
+        'repos': len(per_repo),
+        'commits': sum(d['commits'] for d in per_repo.values()),
+        'loc': sum(d['loc'] for d in per_repo.values()),
+        'tags': sum(d['tags'] for d in per_repo.values()),
+        'languages': len({lang for d in per_repo.values() for lang in d['languages']}),
+        'loc_by_lang': {lang: sum(d['loc_by_lang'].get(lang, 0) for d in per_repo.values())
+                        for lang in sorted(PROGRAMMING_LANGS)},
+        'first': min(firsts, key=datetime.fromisoformat) if firsts else '',
+        'last': max(lasts, key=datetime.fromisoformat) if lasts else '',
+        'calendar_days': 0,
+        'daily_rate': 0,
+    }
+    if firsts and lasts:
+        span_days = datetime.fromisoformat(ecosystem['last']) - datetime.fromisoformat(ecosystem['first'])
+        ecosystem['calendar_days'] = span_days.days + 1
+        ecosystem['daily_rate'] = round(ecosystem['commits'] / ecosystem['calendar_days'], 1)
+
+    measured = [d for d in per_repo.values() if d['measured']]
+    return {
+        'ecosystem': ecosystem,
+        'measured': {
+            'repos': len(measured),
+            'commits': sum(d['commits'] for d in measured),
+            'loc': sum(d['loc'] for d in measured),
+            'tags': sum(d['tags'] for d in measured),
+        },
+    }
+
+
+def read_aggregates():
+    """The persisted artifact, or {} if it is missing or from another version."""
+    try:
+        artifact = json.loads(AGGREGATES_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+    return artifact if artifact.get('version') == AGGREGATES_VERSION else {}
+
+
+def _write_aggregates(artifact):
+    AGGREGATES_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = AGGREGATES_PATH.with_suffix('.tmp')
+    tmp.write_text(json.dumps(artifact, indent=2) + '\n')
+    os.replace(tmp, AGGREGATES_PATH)
+
+
+def load_aggregates(repos, jobs=1, timeout=None, force=False):
+    """Aggregates for the present repos in {name: path}, rebuilding stale entries.
+
+    Returns {'version', 'generated', 'repos': {name: {...}}, 'ecosystem': {...},
+    'measured': {...}}, with repos in input order. Repos that fail or exceed
+    their time budget are left out, as with map_repos().
+    """
+    repos = present_repos(repos)
+    cached = {} if force else read_aggregates().get('repos', {})
+    with span('ref fingerprints', jobs=jobs):
+        fingerprints = map_repos(lambda name, path: ref_fingerprint(path)[1], repos, jobs, timeout)
+    stale = {name: path for name, path in repos.items() if name in fingerprints
+             and (cached.get(name, {}).get('path') != str(path)
+                  or cached[name].get('fingerprint') != fingerprints[name])}
+
+    collected = {}
+    if stale:
+        with span('collect repos', jobs=jobs, repos=len(stale)):
+            collected = map_repos(collect_repo, stale, jobs, timeout)
+        with span('save blob cache'):
+            save_blob_cache()
+
+    measured = measured_repos()
+    per_repo = {}
+    for name in repos:
+        entry = collected.get(name) if name in stale else cached.get(name)
+        if entry is not None and name in fingerprints:
+            per_repo[name] = {**entry, 'measured': name in measured}
+
+    artifact = {
+        'version': AGGREGATES_VERSION,
+        'generated': datetime.now(timezone.utc).isoformat(),
+        'repos': per_repo,
+        **summarize(per_repo),
+    }
+    with span('write aggregates'):
+        _write_aggregates(artifact)
+    return artifact
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the per-repo and ecosystem aggregates.')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of repos to process concurrently (default: 1)')
+    parser.add_argument('--timeout', type=float, default=None,
+                        help='per-repo time budget in seconds; slower repos are skipped')
+    parser.add_argument('--force', action='store_true',
+                        help='collect every repo again even if its refs are unchanged')
+    parser.add_argument('--prepare', action='store_true',
+                        help='first write missing or stale commit-graphs (see analytics.prepare)')
+    parser.add_argument('--trace', metavar='PATH', default=None,
+                        help='append Chrome trace events to PATH (same as WHITEPAPER_TRACE=PATH)')
+    args = parser.parse_args(argv)
+    if args.trace:
+        tracing.enable(args.trace)
+
+    repos = load_repos().all
+    if args.prepare:
+        prepare_repos(repos, args.jobs, args.timeout)
+    aggregates = load_aggregates(repos, args.jobs, args.timeout, args.force)
+    for name, d in aggregates['repos'].items():
+        print(f'  {name:25s} {d["commits"]:4d} commits  {d["loc"]:>8,} LOC  {d["tags"]:3d} tags')
+    eco = aggregates['ecosystem']
+    print(f'  Saved: {AGGREGATES_PATH} ({eco["repos"]} repos, {eco["commits"]} commits)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,290 @@
+"""
+Benchmark the analytics pipeline on synthetic git repos.
+
+For each requested size a synthetic repo is generated (synthetic_repo.py) and
+the pipeline stages run against it in-process with cold caches, in build order:
+
+  extraction         git log parse into the history tables (cold cache)
+  extraction_cached  the same call answered from the history cache
+  loc                file index + blob line counts (cold blob cache)
+  aggregates         aggregates.load_aggregates: per-repo totals, artifact written
+  dataset            dataset.build_dataset: DataFrames (aggregates reused)
+  aggregation        every chart's prepare step
+  rendering          every chart drawn and saved (profile per --profile)
+  metrics            metrics.tex from the reused aggregates
+
+Each stage records wall time, CPU time of this process and of its git
+children, and the tracemalloc peak. Results go to a JSON report; --baseline
+compares against an earlier report and exits non-zero on regressions.
+
+Usage:
+  python3 -m analytics.benchmark --commits 1000,10000,100000 -o bench.json
+  python3 -m analytics.benchmark --commits 10000 --baseline bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .synthetic_repo import make_repo
+
+
+# Stage slowdowns under this many seconds are treated as noise
+NOISE_FLOOR = 0.05
+
+
+class StageTimer:
+    """Collects {stage: {wall_s, cpu_s, child_cpu_s, peak_bytes}} for one run."""
+
+    def __init__(self, trace_memory=True, verbose=False):
+        self.trace_memory = trace_memory
+        self.verbose = verbose
+        self.stages = {}
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        quiet = contextlib.nullcontext() if self.verbose else contextlib.redirect_stdout(io.StringIO())
+        if self.trace_memory:
+            tracemalloc.start()
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        try:
+            with quiet:
+                yield
+        finally:
+            result = {
+                'wall_s': round(time.perf_counter() - wall, 4),
+                'cpu_s': round(time.process_time() - cpu, 4),
+                'child_cpu_s': round(_child_cpu(children), 4),
+            }
+            if self.trace_memory:
+                result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            self.stages[name] = result
+            print(f'    {name:18s} {result["wall_s"]:9.3f}s'
+                  + (f'  {result["peak_bytes"] / 2**20:8.1f} MiB peak' if self.trace_memory else ''))
+
+
+def _child_cpu(before):
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+
+
+def _max_rss_bytes():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024  # Linux reports KiB
+
+
+@contextlib.contextmanager
+def scratch_paths(cache_dir, out_dir):
+    """Point every cache and figure output at the benchmark's scratch dirs.
+
+    The module globals are patched rather than WHITEPAPER_CACHE_DIR, which
+    only takes effect before the modules are first imported, and restored
+    afterwards, so an in-process run leaves the real build untouched.
+    """
+    from . import aggregates, code_age, figures, file_index, git_history, github_issues, loc
+    patches = [
+        (git_history, 'CACHE_DIR', cache_dir),
+        (git_history, 'HISTORY_DIR', cache_dir / 'history'),
+        (loc, 'BLOB_CACHE_PATH', cache_dir / 'blob_lines.pickle'),
+        (loc, '_blob_lines', None),
+        (loc, '_blob_lines_dirty', False),
+        (aggregates, 'AGGREGATES_PATH', cache_dir / 'aggregates.json'),
+        (github_issues, 'CACHE_PATH', cache_dir / 'github_issues.json'),
+        (code_age, 'CHECKPOINT_DIR', cache_dir / 'theseus'),
+        (figures, 'OUTPUT_DIR', out_dir),
+        (figures, 'MANIFEST_PATH', out_dir / 'figures-manifest.json'),
+        (figures, '_profile', figures._profile),
+    ]
+    saved = [(module, attr, getattr(module, attr)) for module, attr, _ in patches]
+    for module, attr, value in patches:
+        setattr(module, attr, value)
+    file_index._indexes.clear()
+    try:
+        yield
+    finally:
+        for module, attr, value in saved:
+            setattr(module, attr, value)
+        file_index._indexes.clear()
+
+
+def _reset_caches(cache_dir):
+    """Empty the scratch on-disk and in-process caches so every run starts cold."""
+    from . import file_index, loc
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    loc._blob_lines = None
+    loc._blob_lines_dirty = False
+    file_index._indexes.clear()
+
+
+def run_size(params, workdir, cache_dir, out_dir, args):
+    """Generate (or reuse) one synthetic repo and time every pipeline stage.
+
+    Runs inside scratch_paths(): cache_dir and out_dir belong to the benchmark.
+    """
+    from . import charts, figures, metrics
+    from .aggregates import load_aggregates
+    from .dataset import build_dataset
+    from .file_index import file_index
+    from .git_history import load_history
+    from .loc import save_blob_cache
+
+    name = 'c{commits}-f{files}-t{tags}-b{binary_ratio}-s{seed}'.format(**params)
+    repo = workdir / name
+    timer = StageTimer(args.trace_memory, args.verbose)
+    print(f'  {name}')
+
+    reused = (repo / '.git').exists()
+    if not reused:
+        with timer.stage('generate'):
+            make_repo(repo, **params)
+
+    _reset_caches(cache_dir)
+    with timer.stage('extraction'):
+        history = load_history(repo)
+    with timer.stage('extraction_cached'):
+        load_history(repo)
+    with timer.stage('loc'):
+        file_index(repo).loc()
+        save_blob_cache()
+
+    repos = {'Synthetic': str(repo)}
+    with timer.stage('aggregates'):
+        load_aggregates(repos)
+    with timer.stage('dataset'):
+        data = build_dataset(repos)
+
+    inputs = {}
+    with timer.stage('aggregation'):
+        for chart_name, (prepare, _draw) in charts.CHARTS.items():
+            inputs[chart_name] = prepare(data)
+
+    figures.set_profile(args.profile)
+    chart_times = {}
+    with timer.stage('rendering'):
+        for chart_name, (_prepare, draw) in charts.CHARTS.items():
+            if inputs[chart_name] is None:
+                continue
+            start = time.perf_counter()
+            figures.render_figure(chart_name, draw, inputs[chart_name], force=True)
+            chart_times[chart_name] = round(time.perf_counter() - start, 4)
+
+    with timer.stage('metrics'):
+        m = metrics.summarize(load_aggregates(repos), {})
+        metrics.write_metrics(metrics.metrics_lines(m, 0, 'benchmark'), out_dir / 'metrics.tex')
+
+    return {
+        'name': name,
+        'params': params,
+        'reused_repo': reused,
+        'rows': {'commits': len(history.commits), 'file_changes': len(history.changes)},
+        'stages': timer.stages,
+        'charts': chart_times,
+        'max_rss_bytes': _max_rss_bytes(),
+    }
+
+
+def compare(report, baseline, threshold):
+    """Stage wall times that grew past threshold x the baseline run of the same name."""
+    old_runs = {run['name']: run for run in baseline.get('runs', [])}
+    regressions = []
+    for run in report['runs']:
+        old = old_runs.get(run['name'])
+        if not old:
+            continue
+        for stage, result in run['stages'].items():
+            before = old['stages'].get(stage, {}).get('wall_s')
+            after = result['wall_s']
+            if before and after > before * threshold and after - before > NOISE_FLOOR:
+                regressions.append((run['name'], stage, before, after))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the analytics pipeline on synthetic repos.')
+    parser.add_argument('--commits', default='1000,10000',
+                        help='comma-separated commit counts, one run each (default: 1000,10000)')
+    parser.add_argument('--files', type=int, default=None,
+                        help='files per repo (default: commits / 10, between 50 and 20000)')
+    parser.add_argument('--tags', type=int, default=20)
+    parser.add_argument('--binary-ratio', type=float, default=0.1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--profile', default='default',
+                        help='figure output profile used for the rendering stage (default: default)')
+    parser.add_argument('--workdir', type=Path, default=None,
+                        help='where synthetic repos are kept; existing repos are reused '
+                             '(default: a temporary directory, removed afterwards)')
+    parser.add_argument('--no-tracemalloc', dest='trace_memory', action='store_false',
+                        help='skip tracemalloc peaks (lower timing overhead)')
+    parser.add_argument('-o', '--output', type=Path, default=Path('benchmark-report.json'),
+                        help='JSON report path (default: benchmark-report.json)')
+    parser.add_argument('--baseline', type=Path, default=None,
+                        help='earlier report to compare against; exit 1 on regressions')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='slowdown ratio counted as a regression (default: 1.25)')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='show the pipeline output of each stage')
+    args = parser.parse_args(argv)
+
+    scratch = Path(tempfile.mkdtemp(prefix='whitepaper-bench-'))
+    workdir = args.workdir or scratch / 'repos'
+    workdir.mkdir(parents=True, exist_ok=True)
+    cache_dir = scratch / 'cache'
+    out_dir = scratch / 'out'
+    out_dir.mkdir()
+
+    report = {
+        'generated': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'trace_memory': args.trace_memory,
+        'profile': args.profile,
+        'runs': [],
+    }
+    print('Benchmarking pipeline on synthetic repos...')
+    try:
+        with scratch_paths(cache_dir, out_dir):
+            for commits in [int(n) for n in args.commits.split(',') if n.strip()]:
+                params = {
+                    'commits': commits,
+                    'files': args.files or min(max(commits // 10, 50), 20000),
+                    'tags': args.tags,
+                    'binary_ratio': args.binary_ratio,
+                    'seed': args.seed,
+                }
+                report['runs'].append(run_size(params, workdir, cache_dir, out_dir, args))
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    args.output.write_text(json.dumps(report, indent=2) + '\n')
+    print(f'  Saved: {args.output}')
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        for key in ('profile', 'trace_memory', 'cpu_count'):
+            if baseline.get(key) != report[key]:
+                print(f'  WARNING: baseline {key} is {baseline.get(key)!r}, this run {report[key]!r}')
+        regressions = compare(report, baseline, args.threshold)
+        for name, stage, before, after in regressions:
+            print(f'  REGRESSION: {name} {stage}: {before:.3f}s -> {after:.3f}s')
+        if regressions:
+            sys.exit(1)
+        print(f'  No regressions against {args.baseline}')
+
+
+if __name__ == '__main__':
+    main()
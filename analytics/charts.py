@@ -0,0 +1,439 @@
+"""
+Git Visualization Charts for WhitePaper
+Generates publication-quality figures from git data across all repos.
+
+Tools: matplotlib, pandas (imported on first use), SciencePlots, matplot2tikz
+Standards: NIST SP 800-53 CM-3 (traceability through version control)
+"""
+
+import argparse
+import json
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+from . import figures, tracing
+from .figures import (HAS_TIKZ, PROFILES, get_profile, pyplot, render_figure,
+                      save_figure, set_profile, size_report, stacked_bars, update_manifest)
+from .prepare import prepare_repos
+from .repos import load_repos
+from .tracing import span
+
+COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2',
+          '#7f7f7f', '#bcbd22', '#17becf', '#aec7e8', '#ffbb78', '#98df8a', '#ff9896',
+          '#c5b0d5', '#c49c94', '#f7b6d2', '#c7c7c7', '#dbdb8d', '#9edae5']
+
+# Chart registry: name -> (aggregate inputs from the Dataset, draw from those inputs)
+Chart = namedtuple('Chart', 'prepare draw')
+CHARTS = {}
+
+
+def chart(name, prepare):
+    """Register a draw function under the figure name it saves.
+
+    prepare(data) aggregates the chart's inputs from the shared Dataset (or
+    returns None to skip the chart); the figure cache is keyed on its result.
+    """
+    def register(draw):
+        CHARTS[name] = Chart(prepare, draw)
+        return draw
+    return register
+
+
+# ============================================================================
+# Chart 1: Cumulative Commits Over Time (All Repos)
+# ============================================================================
+def cumulative_commits_data(data):
+    from .downsample import lttb
+    series = {}
+    for repo_name, group in data.df.groupby('repo', observed=True):
+        daily = group.groupby('date').size().sort_index().cumsum()
+        series[repo_name] = daily.iloc[lttb(daily.index.asi8, daily.values, figures.max_points())]
+    return series
+
+
+@chart('cumulative_commits', cumulative_commits_data)
+def cumulative_commits(series):
+    print('Chart 1: Cumulative commits over time...')
+    plt = pyplot()
+    fig, ax = plt.subplots(figsize=(8, 4))
+
+    for i, (repo_name, daily) in enumerate(series.items()):
+        ax.step(daily.index, daily.values, where='post',
+                label=f'{repo_name} ({daily.values[-1]})',
+                color=COLORS[i % len(COLORS)], linewidth=1.5)
+
+    figures.date_axis(ax.xaxis)
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Cumulative Commits')
+    ax.set_title('Cumulative Commits Across All Repositories')
+    ax.legend(loc='upper left', fontsize=6, ncol=2)
+    ax.grid(True, alpha=0.3)
+    fig.autofmt_xdate()
+    save_figure(fig, 'cumulative_commits')
+    plt.close()
+
+
+# ============================================================================
+# Chart 2: Daily Commit Activity Heatmap-style Bar Chart
+# ============================================================================
+def activity_bucket(data):
+    """Day, week, month or quarter buckets for the activity and churn charts."""
+    if data.df.empty:
+        return 'day'
+    return figures.time_bucket(data.df['date'].min(), data.df['date'].max())
+
+
+def daily_activity_data(data):
+    bucket = activity_bucket(data)
+    starts = figures.bucket_starts(data.df['date'], bucket)
+    counts = data.df.groupby([starts, 'repo'], observed=True).size().unstack(fill_value=0)
+    return counts, bucket
+
+
+@chart('daily_activity', daily_activity_data)
+def daily_activity(inputs):
+    print('Chart 2: Commit activity...')
+    repo_counts, bucket = inputs
+    plt = pyplot()
+    fig, ax = plt.subplots(figsize=(8, 3.5))
+
+    # Stack bars by repo, one per time bucket
+    centres, width = figures.bucket_bars(repo_counts.index, bucket)
+    stacked_bars(ax, centres, repo_counts.to_numpy(), repo_counts.columns,
+                 [COLORS[i % len(COLORS)] for i in range(len(repo_counts.columns))],
+                 width=width)
+
+    figures.date_axis(ax.xaxis)
+    ax.set_xlabel('Date')
+    ax.set_ylabel(f'Commits per {bucket.title()}')
+    ax.set_title(f'{figures.BUCKETS[bucket][2]} Commit Activity by Repository')
+    ax.legend(loc='upper left', fontsize=6, ncol=3)
+    ax.grid(True, alpha=0.3, axis='y')
+    fig.autofmt_xdate()
+    save_figure(fig, 'daily_activity')
+    plt.close()
+
+
+# ============================================================================
+# Chart 3: Lines of Code Changed (Additions vs Deletions)
+# ============================================================================
+def code_churn_data(data):
+    if data.df_changes.empty:
+        return None
+    bucket = activity_bucket(data)
+    starts = figures.bucket_starts(data.df_changes['date'], bucket)
+    churn = data.df_changes.groupby(starts).agg(
+        additions=('additions', 'sum'),
+        deletions=('deletions', 'sum')
+    )
+    return churn, bucket
+
+
+@chart('code_churn', code_churn_data)
+def code_churn(inputs):
+    print('Chart 3: Code churn (additions vs deletions)...')
+    churn, bucket = inputs
+    plt = pyplot()
+    fig, ax = plt.subplots(figsize=(8, 4))
+
+    centres, width = figures.bucket_bars(churn.index, bucket)
+    ax.bar(centres, churn['additions'],
+           color='#2ca02c', alpha=0.7, label='Additions', width=width)
+    ax.bar(centres, -churn['deletions'],
+           color='#d62728', alpha=0.7, label='Deletions', width=width)
+
+    figures.date_axis(ax.xaxis)
+    ax.set_xlabel('Date')
+    ax.set_ylabel(f'Lines Changed per {bucket.title()}')
+    ax.set_title('Code Churn: Lines Added vs Deleted (All Repos)')
+    ax.legend(fontsize=8)
+    ax.grid(True, alpha=0.3, axis='y')
+    ax.axhline(y=0, color='black', linewidth=0.5)
+    fig.autofmt_xdate()
+    save_figure(fig, 'code_churn')
+    plt.close()
+
+
+# ============================================================================
+# Chart 4: Repo Size Comparison (Horizontal Bar)
+# ============================================================================
+def repo_comparison_data(data):
+    import pandas as pd
+    per_repo = data.aggregates['repos']
+    commits = pd.Series({name: d['commits'] for name, d in per_repo.items()}, dtype='int64')
+    loc_series = pd.Series({name: d['loc'] for name, d in per_repo.items()}, dtype='int64')
+    loc_series = loc_series.sort_values()
+    return {
+        'commits': commits.sort_values(kind='stable'),
+        'loc': loc_series[loc_series > 0],
+        'tags': pd.Series({name: d['tags'] for name, d in per_repo.items()},
+                          dtype='int64').sort_values(),
+        'n_repos': len(per_repo),
+    }
+
+
+@chart('repo_comparison', repo_comparison_data)
+def repo_comparison(inputs):
+    print('Chart 4: Repository comparison...')
+    plt = pyplot()
+    fig, axes = plt.subplots(1, 3, figsize=(12, max(5, inputs['n_repos'] * 0.35)))
+
+    # Commits
+    commits = inputs['commits']
+    axes[0].barh(commits.index, commits.values,
+                 color=COLORS[:len(commits)], alpha=0.85)
+    axes[0].set_xlabel('Commits')
+    axes[0].set_title('Total Commits')
+    for i, v in enumerate(commits):
+        axes[0].text(v + 1, i, str(v), va='center', fontsize=6)
+
+    # Lines of code
+    loc_series = inputs['loc']
+    axes[1].barh(loc_series.index, loc_series.values, color='#2ca02c', alpha=0.85)
+    axes[1].set_xlabel('Lines of Code')
+    axes[1].set_title('Lines of Code')
+    for i, v in enumerate(loc_series):
+        axes[1].text(v + 100, i, f'{v:,}', va='center', fontsize=6)
+
+    # Tags (version releases)
+    tag_series = inputs['tags']
+    axes[2].barh(tag_series.index, tag_series.values, color='#ff7f0e', alpha=0.85)
+    axes[2].set_xlabel('Version Tags')
+    axes[2].set_title('Releases (Tags)')
+    for i, v in enumerate(tag_series):
+        axes[2].text(v + 0.5, i, str(v), va='center', fontsize=6)
+
+    fig.suptitle('Repository Ecosystem Overview', fontsize=12, fontweight='bold')
+    plt.tight_layout()
+    save_figure(fig, 'repo_comparison')
+    plt.close()
+
+
+# ============================================================================
+# Chart 5: Commit Timeline (Hour of Day / Day of Week)
+# ============================================================================
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def commit_patterns_data(data):
+    return {
+        'hourly': data.df.groupby(data.df['datetime'].dt.hour).size(),
+        'daily': data.df['datetime'].dt.day_name().value_counts().reindex(DAY_ORDER, fill_value=0),
+    }
+
+
+@chart('commit_patterns', commit_patterns_data)
+def commit_patterns(inputs):
+    print('Chart 5: Commit patterns (hour/day)...')
+    plt = pyplot()
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+
+    # Hour of day
+    hourly = inputs['hourly']
+    ax1.bar(hourly.index, hourly.values, color='#1f77b4', alpha=0.85)
+    ax1.set_xlabel('Hour of Day (UTC)')
+    ax1.set_ylabel('Commits')
+    ax1.set_title('Commits by Hour of Day')
+    ax1.set_xticks(range(0, 24, 3))
+    ax1.grid(True, alpha=0.3, axis='y')
+
+    # Day of week
+    day_counts = inputs['daily']
+    bar_colors = ['#1f77b4'] * 5 + ['#ff7f0e'] * 2  # weekdays blue, weekends orange
+    ax2.bar(range(7), day_counts.values, color=bar_colors, alpha=0.85)
+    ax2.set_xlabel('Day of Week')
+    ax2.set_ylabel('Commits')
+    ax2.set_title('Commits by Day of Week')
+    ax2.set_xticks(range(7))
+    ax2.set_xticklabels(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])
+    ax2.grid(True, alpha=0.3, axis='y')
+
+    fig.suptitle('Development Patterns', fontsize=12, fontweight='bold')
+    plt.tight_layout()
+    save_figure(fig, 'commit_patterns')
+    plt.close()
+
+
+# ============================================================================
+# Chart 6: Ecosystem Growth Timeline
+# ============================================================================
+def ecosystem_timeline_data(data):
+    import pandas as pd
+    by_repo = data.df.groupby('repo', observed=True)
+    return pd.DataFrame({
+        'first': by_repo['datetime'].min(),
+        'last': by_repo['datetime'].max(),
+        'commits': by_repo.size(),
+    }).sort_values('first').rename(index=str)
+
+
+@chart('ecosystem_timeline', ecosystem_timeline_data)
+def ecosystem_timeline(windows):
+    print('Chart 6: Ecosystem growth timeline...')
+    plt = pyplot()
+    import matplotlib.dates as mdates
+    fig, ax = plt.subplots(figsize=(8, 4))
+
+    # One bar per repo from its first to its last commit; the minimum width
+    # and label gap scale with the overall span so they read at any zoom
+    span = max(mdates.date2num(windows['last'].max()) - mdates.date2num(windows['first'].min()), 1)
+    for i, (repo, start, end, count) in enumerate(windows.itertuples()):
+        start_num = mdates.date2num(start)
+        end_num = mdates.date2num(end)
+        duration = max(end_num - start_num, span / 200)  # minimum bar width for visibility
+        ax.barh(i, duration,
+                left=start_num,
+                height=0.6, color=COLORS[i % len(COLORS)], alpha=0.85)
+        ax.text(start_num + duration + span / 400, i,
+                f'{count} commits', va='center', fontsize=8)
+
+    ax.set_yticks(range(len(windows)))
+    ax.set_yticklabels(windows.index)
+    ax.xaxis_date()
+    figures.date_axis(ax.xaxis)
+    ax.set_xlabel('Date')
+    ax.set_title('Repository Lifecycle: Active Development Windows')
+    ax.grid(True, alpha=0.3, axis='x')
+    fig.autofmt_xdate()
+    save_figure(fig, 'ecosystem_timeline')
+    plt.close()
+
+
+# ============================================================================
+# Summary Statistics JSON (for paper reference)
+# ============================================================================
+def write_stats(data):
+    print('\nGenerating summary statistics...')
+    aggregates = data.aggregates
+    eco = aggregates['ecosystem']
+    stats = {
+        'generated': datetime.now(timezone.utc).isoformat(),
+        'aggregates_version': aggregates['version'],
+        'total_repos': eco['repos'],
+        'total_commits': eco['commits'],
+        'total_loc': eco['loc'],
+        'date_range': {
+            'first': eco['first'],
+            'last': eco['last'],
+        },
+        'per_repo': {},
+    }
+    for name, d in aggregates['repos'].items():
+        stats['per_repo'][name] = {
+            'commits': d['commits'],
+            'loc': d['loc'],
+            'tags': d['tags'],
+            'first_commit': d['first'],
+            'last_commit': d['last'],
+        }
+
+    stats_path = figures.OUTPUT_DIR / 'stats.json'
+    with open(stats_path, 'w') as f:
+        json.dump(stats, f, indent=2)
+    print(f'  Saved: {stats_path}')
+
+
+# ============================================================================
+# Rendering
+# ============================================================================
+_worker_dataset = None
+
+
+def _init_worker(data, profile):
+    global _worker_dataset
+    _worker_dataset = data
+    set_profile(profile)
+
+
+def render_chart(name, data, force=False):
+    """Aggregate and draw one chart unless its figure is current.
+
+    Returns (key, output files) for a freshly drawn figure, else None.
+    """
+    prepare, draw = CHARTS[name]
+    with span(f'prepare {name}'):
+        inputs = prepare(data)
+    if inputs is None:
+        return None
+    return render_figure(name, draw, inputs, force)
+
+
+def _render_in_worker(name, force):
+    try:
+        return render_chart(name, _worker_dataset, force)
+    finally:
+        tracing.flush()  # pool workers exit without running atexit handlers
+
+
+def render_charts(names, data, render_jobs=1, force=False):
+    """Render the named charts, in separate processes when render_jobs > 1."""
+    if render_jobs <= 1 or len(names) <= 1:
+        results = {name: render_chart(name, data, force) for name in names}
+    else:
+        # The platform's default start method: with fork (Linux) workers share the
+        # dataset without pickling, with spawn (macOS, Windows) the initializer
+        # pickles it once per worker
+        ctx = multiprocessing.get_context()
+        with ProcessPoolExecutor(max_workers=min(render_jobs, len(names)), mp_context=ctx,
+                                 initializer=_init_worker, initargs=(data, get_profile())) as pool:
+            futures = {name: pool.submit(_render_in_worker, name, force) for name in names}
+            results = {name: future.result() for name, future in futures.items()}
+    # Manifest is only written here, never from workers
+    update_manifest({name: result for name, result in results.items() if result})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate git visualization charts.')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of repos to process concurrently (default: 1)')
+    parser.add_argument('--timeout', type=float, default=None,
+                        help='per-repo time budget in seconds; slower repos are skipped')
+    parser.add_argument('--only', default=None,
+                        help=f'comma-separated charts to render (default: all of {", ".join(CHARTS)})')
+    parser.add_argument('--render-jobs', type=int, default=1,
+                        help='number of charts to render in parallel processes (default: 1)')
+    parser.add_argument('--profile', choices=list(PROFILES), default=get_profile(),
+                        help='output formats: default (PNG+PDF+TikZ), draft (low-dpi PNG), '
+                             'paper (PDF+TikZ), slides (PNG sized for the slide deck)')
+    parser.add_argument('--force', action='store_true',
+                        help='re-render figures even if their inputs are unchanged')
+    parser.add_argument('--prepare', action='store_true',
+                        help='first write missing or stale commit-graphs (see analytics.prepare)')
+    parser.add_argument('--trace', metavar='PATH', default=None,
+                        help='append Chrome trace events to PATH (same as WHITEPAPER_TRACE=PATH)')
+    args = parser.parse_args(argv)
+    set_profile(args.profile)
+    if args.trace:
+        tracing.enable(args.trace)
+
+    names = list(CHARTS)
+    if args.only:
+        names = [n.strip() for n in args.only.split(',') if n.strip()]
+        unknown = [n for n in names if n not in CHARTS]
+        if unknown:
+            parser.error(f'unknown chart(s): {", ".join(unknown)} (choose from {", ".join(CHARTS)})')
+
+    repos = load_repos().all
+    if args.prepare:
+        prepare_repos(repos, args.jobs, args.timeout)
+    from .dataset import build_dataset
+    with span('build dataset'):
+        data = build_dataset(repos, args.jobs, args.timeout)
+    with span('render charts', charts=len(names), render_jobs=args.render_jobs):
+        render_charts(names, data, args.render_jobs, args.force)
+    with span('write stats.json'):
+        write_stats(data)
+    size_report(names)
+
+    print('\n=== Done! ===')
+    output_dir = figures.OUTPUT_DIR
+    print(f'Generated {len(list(output_dir.glob("*.png")))} PNG charts')
+    print(f'Generated {len(list(output_dir.glob("*.pdf")))} PDF charts')
+    if HAS_TIKZ:
+        print(f'Generated {len(list(output_dir.glob("*.tex")))} TikZ files')
+
+
+if __name__ == '__main__':
+    main()
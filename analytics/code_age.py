@@ -0,0 +1,336 @@
+"""
+Incremental code-age analysis (git-of-theseus style) for the theseus charts.
+
+Walks a repo's first-parent history in fixed time windows and, at the last
+commit of each window, records how many lines survive from every commit:
+grouped by the year they were written (cohorts.json), by file extension
+(exts.json) and by top-level directory (dirs.json), plus each commit's line
+count over time (survival.json). The files use git-of-theseus's JSON layout,
+so theseus.py plots either.
+
+git-of-theseus re-blames every file at every sample. Here only the files
+changed since the previous sample (git diff --raw) are blamed again, with
+`git blame --incremental`; every other file keeps its per-commit line counts,
+and the totals are updated by difference. The state is checkpointed under
+.cache/theseus/ as samples complete, so an interrupted run resumes where it
+stopped and a rerun after new commits only processes the new history.
+
+Usage:
+  python3 -m analytics.code_age                       # Security Toolkit, daily samples
+  python3 -m analytics.code_age --path ~/src/repo --interval-days 7 --jobs 8
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import tracing
+from .figures import OUTPUT_DIR
+from .file_index import BINARY_EXTS
+from .git_history import CACHE_DIR
+from .repo_pool import git, git_stream
+from .repos import is_git_repo, load_repos
+from .tracing import span
+
+THESEUS_DIR = OUTPUT_DIR / 'theseus'
+CHECKPOINT_DIR = CACHE_DIR / 'theseus'
+
+# Bump when the checkpointed state or the way it is computed changes
+CHECKPOINT_VERSION = 2
+
+DEFAULT_REPO = 'Security Toolkit'
+
+# Blob modes worth blaming (regular and executable files; not symlinks/submodules)
+BLAME_MODES = {'100644', '100755'}
+
+
+# ============================================================================
+# Sampling
+# ============================================================================
+def first_parent_commits(repo_path):
+    """[(sha, committer time)] along HEAD's first-parent history, oldest first."""
+    r = git(repo_path, 'log', '--first-parent', '--reverse', '--format=%H %ct', 'HEAD')
+    return [(sha, int(ts)) for sha, ts in (line.split() for line in r.stdout.split('\n') if line)]
+
+
+def sample_commits(commits, interval):
+    """The last commit of each interval-second window, counted from the first commit.
+
+    Windows never move backwards, so samples only ever change at the end as
+    history grows: every sample but the last belongs to a closed window.
+    """
+    samples = []
+    window = None
+    for sha, ts in commits:
+        w = (ts - commits[0][1]) // interval
+        if window is not None and w <= window:
+            samples[-1] = (sha, ts)
+        else:
+            samples.append((sha, ts))
+            window = w
+    return samples
+
+
+# ============================================================================
+# Blame
+# ============================================================================
+def _blameable(mode, file):
+    return mode in BLAME_MODES and not any(file.lower().endswith(ext) for ext in BINARY_EXTS)
+
+
+def changed_files(repo_path, prev, cur):
+    """[(file, blame at cur?)] for files that differ between samples prev and cur.
+
+    For the first sample (prev None) every file in cur's tree is listed.
+    Deleted, binary, symlinked and submodule paths come back as False.
+    """
+    if prev is None:
+        r = git(repo_path, 'ls-tree', '-r', '-z', '--full-tree', cur)
+        entries = (record.split('\t', 1) for record in r.stdout.split('\0') if record)
+        return [(file, _blameable(meta.split(' ')[0], file)) for meta, file in entries]
+    r = git(repo_path, 'diff', '--raw', '-z', '--no-renames', '--no-abbrev', prev, cur)
+    fields = r.stdout.split('\0')
+    changes = []
+    for meta, file in zip(fields[0::2], fields[1::2]):
+        if not meta:
+            continue
+        new_mode, status = meta.split(' ')[1], meta.split(' ')[4]
+        changes.append((file, status != 'D' and _blameable(new_mode, file)))
+    return changes
+
+
+def blame_counts(repo_path, rev, file):
+    """({commit: surviving lines}, {commit: committer time}) for one file at rev."""
+    out = b''.join(git_stream(repo_path, 'blame', '--incremental', rev, '--', file))
+    counts = Counter()
+    times = {}
+    sha = None
+    for line in out.split(b'\n'):
+        fields = line.split(b' ')
+        if (len(fields) == 4 and len(fields[0]) in (40, 64)
+                and fields[1].isdigit() and fields[3].isdigit()):
+            sha = fields[0].decode()
+            counts[sha] += int(fields[3])
+        elif fields[0] == b'committer-time' and sha and len(fields) == 2:
+            times[sha] = int(fields[1])
+    return counts, times
+
+
+# ============================================================================
+# State and checkpoints
+# ============================================================================
+def new_state(repo_path, interval, cohort_format):
+    return {
+        'version': CHECKPOINT_VERSION,
+        'path': str(Path(repo_path).resolve()),
+        'interval': interval,
+        'cohort_format': cohort_format,
+        'samples': [],              # [(sha, ts)] processed so far
+        'files': {},                # file -> Counter{commit: lines}
+        'commit_time': {},          # commit -> committer time
+        'cohort': {},               # commit -> cohort label (commit_time formatted)
+        'by_commit': Counter(),     # commit -> lines > 0, summed over files
+        'died': set(),              # commits whose lines reached 0 since the last sample
+        'by_ext': Counter(),
+        'by_dir': Counter(),
+        'series': {'cohorts': [], 'exts': [], 'dirs': []},  # one {label: lines} per sample
+        'survival': {},             # commit -> [[ts, lines], ...]
+    }
+
+
+def checkpoint_path(repo_path, interval, cohort_format):
+    key = hashlib.sha1(f'{Path(repo_path).resolve()}\0{interval}\0{cohort_format}'.encode())
+    return CHECKPOINT_DIR / f'{key.hexdigest()[:16]}.pickle'
+
+
+def load_checkpoint(path, repo_path, interval, cohort_format, samples):
+    """The saved state if it was built with these settings on a prefix of samples."""
+    try:
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if (state.get('version') != CHECKPOINT_VERSION
+            or state['path'] != str(Path(repo_path).resolve())
+            or state['interval'] != interval or state['cohort_format'] != cohort_format
+            or state['samples'] != samples[:len(state['samples'])]):
+        return None
+    return state
+
+
+def save_checkpoint(path, state):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'wb') as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def _ext(file):
+    return os.path.splitext(file)[1]
+
+
+def _top_dir(file):
+    return file.split('/', 1)[0] + '/' if '/' in file else '/'
+
+
+def _replace_file(state, file, counts):
+    """Swap a file's per-commit line counts, keeping the running totals in step."""
+    old = state['files'].pop(file, None)
+    if old:
+        lines = sum(old.values())
+        by_commit = state['by_commit']
+        by_commit.subtract(old)
+        for commit in old:
+            if by_commit[commit] <= 0:
+                del by_commit[commit]
+                state['died'].add(commit)
+        state['by_ext'][_ext(file)] -= lines
+        state['by_dir'][_top_dir(file)] -= lines
+    if counts:
+        lines = sum(counts.values())
+        state['files'][file] = counts
+        state['by_commit'].update(counts)
+        state['by_ext'][_ext(file)] += lines
+        state['by_dir'][_top_dir(file)] += lines
+
+
+def _record_sample(state, sha, ts):
+    """Append the current totals as the sample at (sha, ts)."""
+    alive = state['by_commit']
+    labels = state['cohort']
+    cohorts = Counter()
+    for commit, lines in alive.items():
+        cohort = labels.get(commit)
+        if cohort is None:
+            cohort = labels[commit] = time.strftime(
+                state['cohort_format'], time.gmtime(state['commit_time'][commit]))
+        cohorts[cohort] += lines
+    series = state['series']
+    series['cohorts'].append(dict(cohorts))
+    series['exts'].append(dict(+state['by_ext']))
+    series['dirs'].append(dict(+state['by_dir']))
+
+    survival = state['survival']
+    for commit, lines in alive.items():
+        survival.setdefault(commit, []).append([ts, lines])
+    # A commit whose last lines just disappeared gets one final zero entry
+    for commit in state['died']:
+        history = survival.get(commit)
+        if commit not in alive and history and history[-1][1] > 0:
+            history.append([ts, 0])
+    state['died'].clear()
+    state['samples'].append((sha, ts))
+
+
+def advance(state, repo_path, sha, ts, pool):
+    """Re-blame the files changed since the last sample and record sample sha."""
+    prev = state['samples'][-1][0] if state['samples'] else None
+    changes = changed_files(repo_path, prev, sha)
+    to_blame = [file for file, blame in changes if blame]
+    results = dict(zip(to_blame, pool.map(lambda file: blame_counts(repo_path, sha, file),
+                                          to_blame)))
+    for file, blame in changes:
+        counts, times = results.get(file, (None, {}))
+        state['commit_time'].update(times)
+        _replace_file(state, file, counts)
+    _record_sample(state, sha, ts)
+    return len(to_blame)
+
+
+# ============================================================================
+# Output
+# ============================================================================
+def _iso(ts):
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+def write_outputs(state, outdir):
+    """Write cohorts/exts/dirs/survival JSON in git-of-theseus's layout."""
+    outdir.mkdir(parents=True, exist_ok=True)
+    ts = [_iso(t) for _, t in state['samples']]
+    for name, series in state['series'].items():
+        labels = sorted(set().union(*series))
+        data = {'y': [[snap.get(label, 0) for snap in series] for label in labels],
+                'ts': ts, 'labels': labels}
+        (outdir / f'{name}.json').write_text(json.dumps(data))
+    (outdir / 'survival.json').write_text(json.dumps(state['survival']))
+    print(f'  Saved: {outdir}/{{cohorts,exts,dirs,survival}}.json')
+
+
+def analyze(repo_path, interval, cohort_format='%Y', jobs=1, restart=False,
+            checkpoint_every=60.0):
+    """Bring the code-age state of repo_path up to HEAD and return it."""
+    with span('first-parent history'):
+        samples = sample_commits(first_parent_commits(repo_path), interval)
+    ckpt = checkpoint_path(repo_path, interval, cohort_format)
+    state = None if restart else load_checkpoint(ckpt, repo_path, interval, cohort_format, samples)
+    if state is None:
+        state = new_state(repo_path, interval, cohort_format)
+    done = len(state['samples'])
+    print(f'Code age: {len(samples)} samples, {done} from checkpoint')
+
+    # The last sample's window is still open: it is recomputed on every run
+    # and never checkpointed, so the checkpoint stays a prefix of later runs
+    closed = len(samples) - 1
+    blamed = 0
+    last_save = last_report = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool, \
+            span('code age', samples=len(samples) - done, resumed=done):
+        for i, (sha, ts) in enumerate(samples[done:], done):
+            blamed += advance(state, repo_path, sha, ts, pool)
+            now = time.monotonic()
+            if i < closed and (now - last_save >= checkpoint_every or i == closed - 1):
+                with span('save checkpoint'):
+                    save_checkpoint(ckpt, state)
+                last_save = now
+            if now - last_report >= 5 or i == len(samples) - 1:
+                print(f'  [{i + 1}/{len(samples)}] {sha[:8]} {_iso(ts)[:10]}: '
+                      f'{len(state["files"])} files, {blamed} blamed so far')
+                last_report = now
+    return state
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compute code-age (theseus) series for a repo.')
+    parser.add_argument('--repo', default=DEFAULT_REPO,
+                        help=f'repo name from the repo table (default: {DEFAULT_REPO})')
+    parser.add_argument('--path', default=None, help='repo path (overrides --repo)')
+    parser.add_argument('--interval-days', type=float, default=1,
+                        help='sample the last commit of every N days of history (default: 1)')
+    parser.add_argument('--cohort-format', default='%Y',
+                        help='strftime format grouping commits into cohorts (default: %%Y)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of files to blame concurrently (default: 1)')
+    parser.add_argument('--outdir', type=Path, default=THESEUS_DIR,
+                        help=f'where the JSON files go (default: {THESEUS_DIR})')
+    parser.add_argument('--restart', action='store_true',
+                        help='ignore the checkpoint and start from the first commit')
+    parser.add_argument('--checkpoint-every', type=float, default=60,
+                        help='seconds between checkpoint saves (default: 60)')
+    parser.add_argument('--trace', metavar='PATH', default=None,
+                        help='append Chrome trace events to PATH (same as WHITEPAPER_TRACE=PATH)')
+    args = parser.parse_args(argv)
+    if args.trace:
+        tracing.enable(args.trace)
+
+    repo_path = args.path or load_repos().all.get(args.repo)
+    if not repo_path or not is_git_repo(repo_path):
+        parser.error(f'not a git repository: {repo_path or args.repo}')
+    interval = max(1, int(args.interval_days * 86400))
+
+    state = analyze(repo_path, interval, args.cohort_format, args.jobs, args.restart,
+                    args.checkpoint_every)
+    with span('write theseus json'):
+        write_outputs(state, args.outdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Shared dataset for the charts and summary statistics.
+
+Loads the repo aggregates (commits, LOC, tags, dates; see aggregates.py) and
+every repo's commits and file changes as pandas DataFrames over the columnar
+history tables. Commits include merges, matching the aggregates.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from .aggregates import load_aggregates
+from .git_history import load_history
+from .repo_pool import map_repos
+from .tracing import span
+
+Dataset = namedtuple('Dataset', 'repos df df_changes aggregates')
+
+
+def _categories(values):
+    """Category index with a fixed string dtype, even when there are no values.
+
+    An empty list would otherwise infer object dtype, which union_categoricals
+    refuses to merge with the string categories of non-empty repos.
+    """
+    return pd.Index(values, dtype=str)
+
+
+def commit_frame(table, repo):
+    """DataFrame over a columnar CommitTable (no per-row Python objects)."""
+    return pd.DataFrame({
+        'hash': table.hash,
+        'datetime': pd.to_datetime(np.frombuffer(table.time, np.int64), unit='s', utc=True),
+        'author': pd.Categorical.from_codes(np.frombuffer(table.author, np.int32),
+                                            _categories(table.authors.values)),
+        'message': table.message,
+        'merge': np.frombuffer(table.merge, np.int8).astype(bool),
+        'repo': pd.Categorical.from_codes(np.zeros(len(table), np.int8), _categories([repo])),
+    })
+
+
+def change_frame(table, repo):
+    """DataFrame over a columnar ChangeTable (no per-row Python objects)."""
+    return pd.DataFrame({
+        'commit': np.frombuffer(table.commit, np.int32),
+        'datetime': pd.to_datetime(np.frombuffer(table.time, np.int64), unit='s', utc=True),
+        'additions': np.frombuffer(table.additions, np.int32),
+        'deletions': np.frombuffer(table.deletions, np.int32),
+        'file': pd.Categorical.from_codes(np.frombuffer(table.file, np.int32),
+                                          _categories(table.files.values)),
+        'repo': pd.Categorical.from_codes(np.zeros(len(table), np.int8), _categories([repo])),
+    })
+
+
+def concat_frames(frames, categorical):
+    """pd.concat that keeps per-repo categorical columns categorical."""
+    merged = pd.concat([f.drop(columns=categorical) for f in frames], ignore_index=True)
+    for col in categorical:
+        merged[col] = union_categoricals([f[col] for f in frames])
+    return merged
+
+
+def extract_repo(name, path):
+    """Load one repo's commits and file changes as DataFrames."""
+    history = load_history(path)
+    commits = commit_frame(history.commits, name)
+    return commits, change_frame(history.changes, name), history.source
+
+
+def build_dataset(repos, jobs=1, timeout=None):
+    """Load the aggregates and extract commits and file changes for all repos."""
+    print('Extracting git data...')
+    with span('aggregates', jobs=jobs):
+        aggregates = load_aggregates(repos, jobs, timeout)
+    repos = {name: repos[name] for name in aggregates['repos']}
+
+    commit_frames = []
+    change_frames = []
+    with span('extract history', jobs=jobs):
+        extracted = map_repos(extract_repo, repos, jobs, timeout)
+    for name, (commits, changes, source) in extracted.items():
+        commit_frames.append(commits)
+        change_frames.append(changes)
+        print(f'  {name}: {len(commits)} commits, {len(changes)} file changes ({source})')
+
+    with span('concat frames'):
+        df = concat_frames(commit_frames, ['author', 'repo'])
+        df['date'] = df['datetime'].dt.tz_localize(None).dt.floor('D')
+
+        df_changes = concat_frames(change_frames, ['file', 'repo'])
+        df_changes['date'] = df_changes['datetime'].dt.tz_localize(None).dt.floor('D')
+
+    repos = {name: repos[name] for name in extracted}
+    print(f'\nTotal: {len(df)} commits across {len(repos)} repos\n')
+    return Dataset(repos, df, df_changes, aggregates)
@@ -0,0 +1,59 @@
+"""
+Downsampling of long time series before they are plotted.
+
+Multi-year histories have thousands of samples per series, and every one of
+them becomes a path vertex in the PDF and TikZ outputs. The figures need a
+few hundred points (the active profile's `points`, see figures.py).
+
+lttb() picks points for a single line or step series with
+Largest-Triangle-Three-Buckets, which keeps its visual shape. stack_indices()
+picks one shared set of x positions for a stackplot: the first and last
+sample, plus the samples where the stacked total is lowest and highest in
+each bucket. Peaks and dips of the total survive any reduction.
+
+Both return sorted indices into the original series, so callers slice x and
+y themselves and series short enough already are returned unchanged.
+"""
+
+import numpy as np
+
+
+def lttb(x, y, target):
+    """Indices of `target` points of (x, y) chosen by Largest-Triangle-Three-Buckets."""
+    x = np.asarray(x, float)
+    y = np.asarray(y, float)
+    n = len(x)
+    if target >= n or target < 3:
+        return np.arange(n)
+
+    # target - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, target - 1).astype(np.int64)
+    picked = np.empty(target, np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(target - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            cx, cy = x[hi:edges[i + 2]].mean(), y[hi:edges[i + 2]].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        # Twice the triangle area between the last pick, each candidate and the next bucket's mean
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(area.argmax())
+        picked[i + 1] = a
+    return picked
+
+
+def stack_indices(y, target):
+    """Shared indices for stacked series y (rows x samples), keeping total extremes."""
+    total = np.asarray(y, float).sum(axis=0)
+    n = len(total)
+    buckets = (target - 2) // 2
+    if target >= n or buckets < 1:
+        return np.arange(n)
+
+    bucket = np.arange(n) * buckets // n
+    order = np.lexsort((total, bucket))  # by bucket, then by total
+    last = np.flatnonzero(np.diff(bucket[order], append=buckets))
+    first = np.concatenate([[0], last[:-1] + 1])
+    return np.unique(np.concatenate([[0, n - 1], order[first], order[last]]))
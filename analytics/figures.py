@@ -0,0 +1,442 @@
+"""
+Shared figure output for analytics.charts and analytics.theseus.
+
+Applies the publication style, saves figures in the formats of the selected
+output profile, and skips figures whose inputs have not changed. Each figure
+is keyed by a hash of its aggregated input data, its draw function's source,
+the style and the output profile; keys and the files written (with their
+size and mtime) are stored in .cache/figures-manifest.json. When a figure's
+key matches and all of its files are as they were written, drawing and
+saving are skipped entirely, so a rebuild with no data change touches no
+figure files. A fresh checkout has no manifest and renders every figure
+once.
+
+Output profiles (--profile, or WHITEPAPER_FIGURE_PROFILE):
+  default  300-dpi PNG + PDF (+ TikZ when matplot2tikz is installed)
+  draft    72-dpi PNG only, for fast iteration
+  paper    PDF (+ TikZ) only, what whitepaper.tex reads
+  slides   PNG sized for the 11.5in-wide chart slots in analytics/slides.py
+When a profile writes more than one file, the formats are saved concurrently:
+each extra PNG/PDF format is written by a forked child that inherits the
+drawn figure (no pickling), while this process writes the last format and
+the TikZ export. Where fork is not the default start method (macOS, where
+forking after the system frameworks have loaded can crash the child, and
+Windows), formats are saved sequentially.
+"""
+
+import hashlib
+import inspect
+import json
+import multiprocessing
+import os
+from collections import namedtuple
+from importlib import metadata
+from importlib.util import find_spec
+from pathlib import Path
+
+from .git_history import CACHE_DIR
+from .tracing import span
+
+# matplotlib is imported on first draw (pyplot()), so checking the figure
+# cache stays cheap; optional packages are only probed for here.
+
+# SciencePlots for publication-quality styling
+HAS_SCIENCEPLOTS = find_spec('scienceplots') is not None
+STYLE = ['science', 'ieee', 'no-latex'] if HAS_SCIENCEPLOTS else ['seaborn-v0_8-paper']
+
+# matplot2tikz for LaTeX export
+HAS_TIKZ = find_spec('matplot2tikz') is not None
+
+_plt = None
+
+
+def pyplot():
+    """matplotlib.pyplot with the Agg backend and publication style applied."""
+    global _plt
+    if _plt is None:
+        import matplotlib
+        matplotlib.use('Agg')  # Non-interactive backend
+        import matplotlib.pyplot as plt
+        if HAS_SCIENCEPLOTS:
+            import scienceplots  # noqa: F401
+        plt.style.use(STYLE)
+        _plt = plt
+    return _plt
+
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = REPO_DIR / 'visualizations'
+MANIFEST_PATH = CACHE_DIR / 'figures-manifest.json'
+
+# Bump to invalidate every cached figure (e.g. after changing save_figure)
+FIGURE_CACHE_VERSION = 3
+
+# formats: files written by savefig; dpi: PNG resolution, or None to size the
+# PNG to png_width pixels; tikz: whether figures get TikZ unless they override;
+# points: samples kept per plotted time series (see downsample.py)
+Profile = namedtuple('Profile', 'formats dpi png_width tikz points')
+
+PROFILES = {
+    'default': Profile(('png', 'pdf'), 300, None, True, 600),
+    'draft':   Profile(('png',), 72, None, False, 200),
+    'paper':   Profile(('pdf',), None, None, True, 600),
+    # Charts fill 11.5in of a 13.333in-wide slide: that share of 1920px
+    'slides':  Profile(('png',), None, 1656, False, 600),
+}
+
+# Path vertices a figure may write as vectors before its densest data layers
+# are rasterized in the PDF, and the resolution of those raster layers
+VECTOR_BUDGET = 20000
+RASTER_DPI = 300
+
+_profile = os.environ.get('WHITEPAPER_FIGURE_PROFILE', 'default')
+_saved = []
+_weight = {}
+
+
+def set_profile(name):
+    """Select the output profile used by save_figure() and the figure cache."""
+    global _profile
+    if name not in PROFILES:
+        raise ValueError(f'unknown figure profile {name!r} (choose from {", ".join(PROFILES)})')
+    _profile = name
+
+
+def get_profile():
+    return _profile
+
+
+def max_points():
+    """Samples to keep per plotted time series under the active profile."""
+    return PROFILES[_profile].points
+
+
+def _tight_width(fig):
+    """Width in inches of the figure as saved with bbox_inches='tight'."""
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer())
+    return bbox.width + 2 * pyplot().rcParams['savefig.pad_inches']
+
+
+def vector_weight(artist):
+    """Estimated PDF weight of an artist: the path vertices it writes."""
+    from matplotlib.collections import Collection
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Patch
+    if isinstance(artist, Collection):
+        paths, offsets = artist.get_paths(), artist.get_offsets()
+        if len(paths) == 1 and len(offsets) > 1:  # one marker path stamped at every offset
+            return len(paths[0].vertices) * len(offsets)
+        return sum(len(path.vertices) for path in paths)
+    if isinstance(artist, Patch):
+        return len(artist.get_path().vertices)
+    if isinstance(artist, Line2D):
+        return len(artist.get_xydata())
+    return 0
+
+
+def rasterize_dense(fig, budget):
+    """Rasterize the densest data layers until the figure's vector weight fits budget.
+
+    A layer is one axes' patches, collections or lines. Text, ticks, spines,
+    grids and legends stay vector. Returns (total weight, rasterized weight).
+    """
+    layers = []
+    for ax in fig.axes:
+        for artists in (ax.patches, ax.collections, ax.lines):
+            weight = sum(vector_weight(a) for a in artists if not a.get_rasterized())
+            if weight:
+                layers.append((weight, artists))
+    total = remaining = sum(weight for weight, _ in layers)
+    for weight, artists in sorted(layers, key=lambda layer: -layer[0]):
+        if remaining <= budget:
+            break
+        for artist in artists:
+            artist.set_rasterized(True)
+        remaining -= weight
+    return total, total - remaining
+
+
+def save_figure(fig, name, tikz=None, budget=None, raster_dpi=None):
+    """Save figure in the active profile's formats.
+
+    tikz=True/False overrides the profile's TikZ default for this figure
+    (TikZ is only written when matplot2tikz is available). When the figure's
+    estimated vector weight exceeds budget path vertices (default
+    VECTOR_BUDGET), its densest data layers are embedded in the PDF as
+    raster_dpi images (default RASTER_DPI, see rasterize_dense()); the TikZ
+    export stays vector.
+    """
+    profile = PROFILES[_profile]
+    tikz = (profile.tikz if tikz is None else tikz) and HAS_TIKZ
+    budget = VECTOR_BUDGET if budget is None else budget
+    raster_dpi = raster_dpi or RASTER_DPI
+
+    rasterized = 0
+    if 'pdf' in profile.formats:
+        total, rasterized = rasterize_dense(fig, budget)
+        _weight.update(vector_vertices=total, rasterized_vertices=rasterized)
+        if rasterized:
+            print(f'  Rasterized {rasterized:,} of {total:,} vector vertices '
+                  f'(budget {budget:,}) at {raster_dpi} dpi')
+
+    saves = []
+    for fmt in profile.formats:
+        kwargs = {'bbox_inches': 'tight', 'facecolor': 'white'}
+        if fmt == 'png':
+            kwargs['dpi'] = profile.dpi or profile.png_width / _tight_width(fig)
+        elif fmt == 'pdf' and rasterized:
+            kwargs['dpi'] = raster_dpi
+        saves.append((OUTPUT_DIR / f'{name}.{fmt}', kwargs))
+
+    # Fork a child per extra format when another format or the TikZ export
+    # would otherwise wait on it, but only where fork is the platform default
+    children = []
+    if len(saves) + tikz > 1 and multiprocessing.get_start_method() == 'fork':
+        ctx = multiprocessing.get_context('fork')
+        for path, kwargs in saves[:-1]:
+            child = ctx.Process(target=fig.savefig, args=(path,), kwargs=kwargs)
+            child.start()
+            children.append((path, child))
+        saves = saves[-1:]
+
+    written = []
+    for path, kwargs in saves:
+        with span(f'savefig {path.suffix[1:]}', figure=name):
+            fig.savefig(path, **kwargs)
+        written.append(path)
+
+    if tikz:
+        try:
+            import matplot2tikz
+            tikz_path = OUTPUT_DIR / f'{name}.tex'
+            pyplot().figure(fig.number)
+            with span('matplot2tikz', figure=name):
+                matplot2tikz.save(str(tikz_path))
+            written.append(tikz_path)
+        except Exception as e:
+            print(f'  TikZ export skipped: {e}')
+
+    for path, child in children:
+        with span(f'wait savefig {path.suffix[1:]}', figure=name):
+            child.join()
+        if child.exitcode != 0:
+            raise RuntimeError(f'saving {path} failed (exit code {child.exitcode})')
+        written.append(path)
+
+    for path in sorted(written):
+        print(f'  Saved: {path}')
+    _saved.extend(path.name for path in written)
+
+
+# ============================================================================
+# Time buckets, date axes and stacked bars
+# ============================================================================
+# Bucket -> (pandas period frequency, nominal length in days, adjective)
+BUCKETS = {
+    'day':     ('D', 1, 'Daily'),
+    'week':    ('W', 7, 'Weekly'),
+    'month':   ('M', 30.44, 'Monthly'),
+    'quarter': ('Q', 91.31, 'Quarterly'),
+}
+
+# Most bars a time-bucketed chart draws before moving to a coarser bucket
+MAX_BARS = 180
+
+
+def time_bucket(first, last, max_bars=MAX_BARS):
+    """Finest bucket that covers first..last (Timestamps) in at most max_bars bars."""
+    span_days = (last - first).days + 1
+    for name, (_, days, _) in BUCKETS.items():
+        if span_days / days <= max_bars:
+            return name
+    return 'quarter'
+
+
+def bucket_starts(dates, bucket):
+    """Start of the bucket holding each date, for a pandas datetime Series."""
+    return dates.dt.to_period(BUCKETS[bucket][0]).dt.start_time
+
+
+def bucket_bars(starts, bucket):
+    """Bar centres and width (days) for bars spanning the buckets that begin at starts.
+
+    Daily bars stay centred on their date, as ax.bar draws them.
+    """
+    from datetime import timedelta
+    days = BUCKETS[bucket][1]
+    return starts + timedelta(days=(days - 1) / 2), 0.8 * days
+
+
+def date_axis(axis):
+    """Span-appropriate date ticks and concise labels (the year is shown once)."""
+    import matplotlib.dates as mdates
+    locator = mdates.AutoDateLocator()
+    axis.set_major_locator(locator)
+    axis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+
+
+def stacked_bars(ax, dates, heights, labels, colors, width=0.8, alpha=0.85):
+    """Stacked bars drawn as one compound path per layer instead of a Rectangle per bar.
+
+    dates are the bar centres; heights has one row per date and one column per
+    layer (label). Offsets come from a single cumulative sum and zero-height
+    bars are left out, so matplotlib handles one artist and one path per layer
+    and drawing cost follows the rendered area rather than layers x dates.
+    """
+    import matplotlib.dates as mdates
+    import numpy as np
+    from matplotlib.patches import PathPatch
+    from matplotlib.path import Path as MplPath
+
+    x = mdates.date2num(dates)
+    heights = np.asarray(heights, float)
+    tops = heights.cumsum(axis=1)
+    left, right = x - width / 2, x + width / 2
+    rectangle = [MplPath.MOVETO, MplPath.LINETO, MplPath.LINETO, MplPath.LINETO, MplPath.CLOSEPOLY]
+    for i, label in enumerate(labels):
+        drawn = heights[:, i] != 0
+        x0, x1 = left[drawn], right[drawn]
+        y0, y1 = tops[drawn, i] - heights[drawn, i], tops[drawn, i]
+        verts = np.stack([np.column_stack(corner) for corner in
+                          ((x0, y0), (x0, y1), (x1, y1), (x1, y0), (x0, y0))], axis=1)
+        codes = np.tile(np.array(rectangle, MplPath.code_type), len(verts))
+        layer = PathPatch(MplPath(verts.reshape(-1, 2), codes), facecolor=colors[i],
+                          edgecolor='none', alpha=alpha, label=label)
+        layer.sticky_edges.y.append(0)  # like ax.bar: no margin below the baseline
+        # add_artist(): add_patch() would walk every segment to update the data limits
+        ax.add_artist(layer)
+    if len(x):
+        ax.update_datalim([(left.min(), min(0, tops.min())), (right.max(), max(0, tops.max()))])
+    ax.xaxis_date()
+    ax.autoscale_view()
+
+
+# ============================================================================
+# Figure cache
+# ============================================================================
+def _digest(obj, h):
+    """Feed a stable representation of (nested) chart inputs into hash h."""
+    module = type(obj).__module__
+    if module.startswith('pandas'):
+        import pandas as pd
+        h.update(repr((type(obj).__name__, getattr(obj, 'shape', None))).encode())
+        if isinstance(obj, pd.DataFrame):
+            h.update(repr([(str(c), str(t)) for c, t in obj.dtypes.items()]).encode())
+        elif isinstance(obj, pd.Series):
+            h.update(repr((str(obj.name), str(obj.dtype))).encode())
+        h.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    elif module == 'numpy':
+        h.update(repr((str(getattr(obj, 'dtype', '')), getattr(obj, 'shape', ()))).encode())
+        h.update(obj.tobytes() if hasattr(obj, 'tobytes') else repr(obj).encode())
+    elif isinstance(obj, dict):
+        h.update(b'{')
+        for key in sorted(obj, key=repr):
+            _digest(key, h)
+            _digest(obj[key], h)
+        h.update(b'}')
+    elif isinstance(obj, (list, tuple)):
+        h.update(b'[')
+        for item in obj:
+            _digest(item, h)
+        h.update(b']')
+    else:
+        h.update(repr(obj).encode())
+        h.update(b'\0')
+
+
+def figure_key(name, inputs, draw):
+    """Hash of a figure's inputs, draw code, style and output profile."""
+    h = hashlib.sha256()
+    _digest([FIGURE_CACHE_VERSION, name, STYLE, metadata.version('matplotlib'),
+             _profile, PROFILES[_profile], HAS_TIKZ, inspect.getsource(draw)], h)
+    _digest(inputs, h)
+    return h.hexdigest()
+
+
+def load_manifest():
+    try:
+        return json.loads(MANIFEST_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _stamp(path):
+    """[size, mtime_ns] of an output file, or None if it is missing."""
+    try:
+        st = (OUTPUT_DIR / path).stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def update_manifest(entries):
+    """Record {figure name: (key, output files, PDF weight)} for freshly rendered figures."""
+    if not entries:
+        return
+    manifest = load_manifest()
+    manifest.update({name: {'key': key, 'outputs': outputs,
+                            'stamps': {path: _stamp(path) for path in outputs}, **weight}
+                     for name, (key, outputs, weight) in entries.items()})
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = MANIFEST_PATH.with_suffix('.tmp')
+    tmp.write_text(json.dumps(dict(sorted(manifest.items())), indent=2) + '\n')
+    os.replace(tmp, MANIFEST_PATH)
+
+
+def is_current(name, key, manifest=None):
+    """True if the figure was last rendered with this key and its files are unchanged.
+
+    Files replaced since (e.g. by a git checkout) no longer match their
+    recorded size and mtime, so the figure is rendered again.
+    """
+    manifest = load_manifest() if manifest is None else manifest
+    entry = manifest.get(name)
+    if not isinstance(entry, dict) or entry.get('key') != key or not entry.get('outputs'):
+        return False
+    stamps = entry.get('stamps', {})
+    return all(stamps.get(path) is not None and _stamp(path) == stamps[path]
+               for path in entry['outputs'])
+
+
+def render_figure(name, draw, inputs, force=False):
+    """Call draw(inputs) unless the figure is current.
+
+    draw() is expected to build the figure and call save_figure(). Returns
+    (key, output files, PDF weight) if the figure was drawn, else None; the
+    caller records results with update_manifest().
+    """
+    with span('figure key', figure=name):
+        key = figure_key(name, inputs, draw)
+    if not force and is_current(name, key):
+        print(f'  Unchanged: {name} (skipped)')
+        return None
+    del _saved[:]
+    _weight.clear()
+    with span(f'draw {name}'):
+        draw(inputs)
+        pyplot().close('all')
+    return key, sorted(_saved), dict(_weight)
+
+
+def size_report(names):
+    """Print each figure's output file sizes and PDF vector weight (from the manifest)."""
+    manifest = load_manifest()
+    print('\nFigure outputs:')
+    total = 0
+    for name in names:
+        entry = manifest.get(name)
+        if not isinstance(entry, dict):
+            continue
+        sizes = [(OUTPUT_DIR / path).stat().st_size if (OUTPUT_DIR / path).exists() else 0
+                 for path in entry.get('outputs', [])]
+        total += sum(sizes)
+        files = '  '.join(f'{path.rsplit(".", 1)[-1]} {size / 1024:,.0f} KB'
+                          for path, size in zip(entry.get('outputs', []), sizes))
+        weight = ''
+        if 'vector_vertices' in entry:
+            weight = f'  ({entry["vector_vertices"]:,} vertices'
+            if entry.get('rasterized_vertices'):
+                weight += f', {entry["rasterized_vertices"]:,} rasterized'
+            weight += ')'
+        print(f'  {name:22s} {files}{weight}')
+    print(f'  {"total":22s} {total / 1024:,.0f} KB')
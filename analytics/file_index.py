@@ -0,0 +1,110 @@
+"""
+Per-repo file index shared by LOC, language counting and per-language metrics.
+
+One `git ls-tree -r HEAD` per repo per run is classified into path, extension,
+language and blob id, and memoized in-process. LOC totals, the language count
+and per-language LOC breakdowns are all answered from the same index, with
+line counts coming from the content-addressed cache in loc.py.
+"""
+
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+from .loc import blob_line_counts
+from .repo_pool import git
+
+# Binary extensions to exclude from LOC count
+BINARY_EXTS = {'.pdf', '.png', '.jpg', '.jpeg', '.gif', '.mp4', '.mp3', '.wav',
+               '.pptx', '.xlsx', '.docx', '.zip', '.tar', '.gz', '.ico', '.svg',
+               '.woff', '.woff2', '.ttf', '.eot', '.pyc', '.o', '.a', '.so',
+               '.dylib', '.exe', '.dll', '.bin', '.dat', '.db', '.sqlite',
+               '.class', '.jar'}
+
+LANG_MAP = {
+    '.sh': 'Bash', '.bash': 'Bash',
+    '.py': 'Python',
+    '.ps1': 'PowerShell', '.psm1': 'PowerShell',
+    '.c': 'C', '.h': 'C',
+    '.swift': 'Swift',
+    '.cs': 'C#',
+    '.tex': 'LaTeX', '.bib': 'LaTeX',
+    '.js': 'JavaScript', '.jsx': 'JavaScript',
+    '.ts': 'TypeScript', '.tsx': 'TypeScript',
+    '.html': 'HTML', '.css': 'CSS',
+    '.json': 'JSON', '.yaml': 'YAML', '.yml': 'YAML',
+    '.md': 'Markdown',
+}
+
+# Only count "real" programming languages
+PROGRAMMING_LANGS = {'Bash', 'Python', 'PowerShell', 'C', 'Swift', 'C#',
+                     'LaTeX', 'JavaScript', 'TypeScript'}
+
+FileEntry = namedtuple('FileEntry', 'path ext language blob binary')
+
+
+class FileIndex:
+    """Files in a repo's committed HEAD tree."""
+
+    def __init__(self, repo_path, entries):
+        self.repo_path = repo_path
+        self.entries = entries
+
+    def text_files(self):
+        return [e for e in self.entries if not e.binary]
+
+    def languages(self):
+        """Programming languages present, by file extension."""
+        return {e.language for e in self.entries} & PROGRAMMING_LANGS
+
+    def _line_counts(self):
+        return blob_line_counts(self.repo_path, [e.blob for e in self.text_files()])
+
+    def loc(self):
+        """Lines of code across all non-binary files."""
+        counts = self._line_counts()
+        return sum(counts.get(e.blob, 0) for e in self.text_files())
+
+    def loc_by_language(self):
+        """Lines of code per programming language."""
+        counts = self._line_counts()
+        by_lang = {}
+        for e in self.text_files():
+            if e.language in PROGRAMMING_LANGS:
+                by_lang[e.language] = by_lang.get(e.language, 0) + counts.get(e.blob, 0)
+        return by_lang
+
+
+def build_file_index(repo_path, rev='HEAD'):
+    """List and classify every blob in the tree at rev."""
+    r = git(repo_path, 'ls-tree', '-r', '-z', '--full-tree', rev)
+    entries = []
+    if r.returncode == 0:
+        for record in r.stdout.split('\0'):
+            if not record:
+                continue
+            meta, path = record.split('\t', 1)
+            _mode, obj_type, sha = meta.split(' ')
+            if obj_type != 'blob':  # skip submodule (commit) entries
+                continue
+            lower = path.lower()
+            ext = Path(lower).suffix
+            entries.append(FileEntry(path, ext, LANG_MAP.get(ext), sha,
+                                     any(lower.endswith(b) for b in BINARY_EXTS)))
+    return FileIndex(repo_path, entries)
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def file_index(repo_path):
+    """Return the repo's FileIndex, building it once per run."""
+    key = str(Path(repo_path).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+    if index is None:
+        index = build_file_index(repo_path)
+        with _indexes_lock:
+            index = _indexes.setdefault(key, index)
+    return index
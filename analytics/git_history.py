@@ -0,0 +1,258 @@
+"""
+Cached git history extraction shared by the metrics and chart generators.
+
+Parsed commits and numstat rows are persisted per repo under .cache/history/,
+keyed by a fingerprint of the repo's refs (git for-each-ref + HEAD):
+
+  - refs unchanged:        the cache is returned without running git log
+  - refs moved forward:    only the new commits (old tips..new tips) are parsed
+  - history rewritten:     the repo is re-parsed from scratch
+
+History is stored column-wise (CommitTable, ChangeTable): epoch-second
+timestamps and int32 counts in compact arrays, and authors/paths interned as
+integer codes into per-table category lists, so multi-million-row numstat
+tables stay small and map directly onto numpy/pandas columns.
+
+Standards: NIST SP 800-53 CM-3 (configuration change control)
+"""
+
+import hashlib
+import os
+import pickle
+from array import array
+from collections import namedtuple
+from pathlib import Path
+
+from .repo_pool import git, git_stream
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(os.environ.get('WHITEPAPER_CACHE_DIR', REPO_DIR / '.cache'))
+HISTORY_DIR = CACHE_DIR / 'history'
+
+# Bump when the cached record layout changes; older caches are discarded
+CACHE_VERSION = 3
+
+# Records streamed by iter_log(); `time` is the author date in epoch seconds
+Commit = namedtuple('Commit', 'hash time author message merge')
+FileChange = namedtuple('FileChange', 'hash time additions deletions file')
+History = namedtuple('History', 'commits changes source fingerprint')
+
+
+class Categories:
+    """Interned strings: value <-> integer code, in first-seen order."""
+
+    def __init__(self, values=()):
+        self.values = list(values)
+        self._codes = {v: i for i, v in enumerate(self.values)}
+
+    def code(self, value):
+        c = self._codes.get(value)
+        if c is None:
+            c = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return c
+
+    def __getstate__(self):
+        return self.values
+
+    def __setstate__(self, values):
+        self.__init__(values)
+
+
+class CommitTable:
+    """Commits stored column-wise; merges are included and flagged."""
+
+    def __init__(self):
+        self.hash = []
+        self.time = array('q')       # author date, epoch seconds
+        self.author = array('i')     # code into self.authors
+        self.authors = Categories()
+        self.message = []
+        self.merge = array('b')
+
+    def __len__(self):
+        return len(self.hash)
+
+    def append(self, commit):
+        self.hash.append(commit.hash)
+        self.time.append(commit.time)
+        self.author.append(self.authors.code(commit.author))
+        self.message.append(commit.message)
+        self.merge.append(commit.merge)
+
+
+class ChangeTable:
+    """Per-file numstat rows stored column-wise."""
+
+    def __init__(self):
+        self.commit = array('i')     # row in the repo's CommitTable
+        self.time = array('q')       # author date of that commit, epoch seconds
+        self.file = array('i')       # code into self.files
+        self.files = Categories()
+        self.additions = array('i')
+        self.deletions = array('i')
+
+    def __len__(self):
+        return len(self.commit)
+
+    def append(self, commit_row, change):
+        self.commit.append(commit_row)
+        self.time.append(change.time)
+        self.file.append(self.files.code(change.file))
+        self.additions.append(change.additions)
+        self.deletions.append(change.deletions)
+
+
+def get_ref_tips(repo_path):
+    """Return the sorted 'sha refname' lines for all refs plus HEAD."""
+    r = git(repo_path, 'for-each-ref', '--format=%(objectname) %(refname)')
+    tips = [line for line in r.stdout.split('\n') if line]
+    head = git(repo_path, 'rev-parse', '--verify', '-q', 'HEAD')
+    if head.returncode == 0:
+        tips.append(f'{head.stdout.strip()} HEAD')
+    return sorted(tips)
+
+
+def ref_fingerprint(repo_path):
+    """(tips, sha256 of the tips): identifies everything derived from the refs."""
+    tips = get_ref_tips(repo_path)
+    return tips, hashlib.sha256('\n'.join(tips).encode()).hexdigest()
+
+
+# One NUL-terminated field per value; \x1e marks the start of each commit
+LOG_FORMAT = '%x1e%H%x00%P%x00%at%x00%an%x00%s%x00'
+
+
+def _nul_fields(chunks):
+    """Split a stream of bytes chunks into NUL-delimited text fields."""
+    pending = b''
+    for chunk in chunks:
+        parts = (pending + chunk).split(b'\0')
+        pending = parts.pop()
+        for part in parts:
+            yield part.decode('utf-8', 'replace')
+    if pending:
+        yield pending.decode('utf-8', 'replace')
+
+
+def iter_log(repo_path, revs=None):
+    """Stream Commit and FileChange records from `git log -z --numstat`.
+
+    Each Commit is yielded before the FileChange rows that belong to it.
+    With no revs the whole history (--all) is walked; otherwise revs are fed
+    to git log on stdin, e.g. ['<new tip>', '^<old tip>'].
+    """
+    args = ['log', '-z', '--numstat', f'--pretty=format:{LOG_FORMAT}']
+    args += ['--stdin'] if revs is not None else ['--all']
+    stdin = '\n'.join(revs) + '\n' if revs is not None else None
+    fields = _nul_fields(git_stream(repo_path, *args, input=stdin))
+    commit = None
+    for field in fields:
+        if field.startswith('\x1e'):
+            parents, date, author, subject = (next(fields, '') for _ in range(4))
+            commit = Commit(hash=field[1:], time=int(date or 0), author=author,
+                            message=subject, merge=' ' in parents)
+            yield commit
+        elif field and commit:
+            # numstat: "added<TAB>deleted<TAB>path"; renames leave the path
+            # empty and follow with separate old and new path fields
+            parts = field.lstrip('\n').split('\t', 2)
+            if len(parts) != 3:
+                continue
+            added, deleted, path = parts
+            if not path:
+                next(fields, '')
+                path = next(fields, '')
+            try:
+                yield FileChange(commit.hash, commit.time,
+                                 int(added) if added != '-' else 0,
+                                 int(deleted) if deleted != '-' else 0, path)
+            except ValueError:
+                pass
+
+
+def parse_log(repo_path, revs=None, commits=None, changes=None):
+    """Append iter_log() records to a CommitTable and ChangeTable.
+
+    New tables are created unless existing ones are passed in to extend.
+    """
+    commits = commits if commits is not None else CommitTable()
+    changes = changes if changes is not None else ChangeTable()
+    row = -1
+    for record in iter_log(repo_path, revs):
+        if type(record) is Commit:
+            row = len(commits)
+            commits.append(record)
+        else:
+            changes.append(row, record)
+    return commits, changes
+
+
+def _history_rewritten(repo_path, old_tips, new_tips):
+    """True if any commit reachable from old_tips is no longer reachable now."""
+    old = {t.split(' ', 1)[0] for t in old_tips}
+    new = {t.split(' ', 1)[0] for t in new_tips}
+    if old <= new:
+        return False
+    revs = sorted(old) + [f'^{sha}' for sha in sorted(new)]
+    r = git(repo_path, 'rev-list', '--count', '--stdin', input='\n'.join(revs) + '\n')
+    # A failed walk usually means an old tip was garbage-collected
+    return r.returncode != 0 or r.stdout.strip() != '0'
+
+
+def _cache_path(repo_path):
+    key = hashlib.sha1(str(Path(repo_path).resolve()).encode()).hexdigest()[:16]
+    return HISTORY_DIR / f'{key}.pickle'
+
+
+def _read_cache(path):
+    try:
+        with open(path, 'rb') as f:
+            entry = pickle.load(f)
+    # ImportError: entry pickled under an older module layout
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    return entry if entry.get('version') == CACHE_VERSION else None
+
+
+def _write_cache(path, entry):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'wb') as f:
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def load_history(repo_path):
+    """Return the full History of a repo, using the on-disk cache when possible.
+
+    Commits include merges (flagged by `merge`); numstat rows are only
+    reported by git for non-merge commits. If git log fails part way (e.g. a
+    missing object), CommandError propagates and nothing is cached.
+    """
+    tips, fingerprint = ref_fingerprint(repo_path)
+    path = _cache_path(repo_path)
+    entry = _read_cache(path)
+
+    if entry and entry['fingerprint'] == fingerprint:
+        return History(entry['commits'], entry['changes'], 'cached', fingerprint)
+
+    if entry and not _history_rewritten(repo_path, entry['tips'], tips):
+        new_shas = sorted({t.split(' ', 1)[0] for t in tips})
+        old_shas = sorted({t.split(' ', 1)[0] for t in entry['tips']})
+        commits, changes = parse_log(repo_path, new_shas + [f'^{s}' for s in old_shas],
+                                     entry['commits'], entry['changes'])
+        source = 'incremental'
+    else:
+        commits, changes = parse_log(repo_path)
+        source = 'full'
+
+    _write_cache(path, {
+        'version': CACHE_VERSION,
+        'path': str(Path(repo_path).resolve()),
+        'fingerprint': fingerprint,
+        'tips': tips,
+        'commits': commits,
+        'changes': changes,
+    })
+    return History(commits, changes, source, fingerprint)
@@ -0,0 +1,75 @@
+"""
+Local stand-in for the GitHub GraphQL API, for offline metrics builds.
+
+Answers the batched issue-count queries sent by github_issues.py from a JSON
+fixture of {"owner/repo": count} (a saved .cache/github_issues.json entry's
+"counts" also works). Responses carry an ETag and honor If-None-Match, so the
+client's conditional-request path is exercised too.
+
+Usage:
+  python3 -m analytics.github_fixture_server fixture.json [--port 8765]
+  GITHUB_GRAPHQL_URL=http://127.0.0.1:8765/graphql python3 scripts/generate_metrics.py
+"""
+
+import argparse
+import hashlib
+import json
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIELD_RE = re.compile(r'(\w+): repository\(owner: ("(?:[^"\\]|\\.)*"), name: ("(?:[^"\\]|\\.)*")\)')
+
+
+def load_fixture(path):
+    with open(path) as f:
+        fixture = json.load(f)
+    return fixture.get('counts', fixture)
+
+
+def make_handler(counts):
+    class GraphQLHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length', 0))
+            try:
+                query = json.loads(self.rfile.read(length))['query']
+            except (ValueError, KeyError):
+                self.send_error(400, 'expected a JSON body with a "query" field')
+                return
+            data = {}
+            for alias, owner, name in FIELD_RE.findall(query):
+                slug = f'{json.loads(owner)}/{json.loads(name)}'
+                data[alias] = {'issues': {'totalCount': counts[slug]}} if slug in counts else None
+            body = json.dumps({'data': data}, sort_keys=True).encode()
+            etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return GraphQLHandler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve GitHub issue counts from a JSON fixture.')
+    parser.add_argument('fixture', help='JSON file mapping "owner/repo" to issue count')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(load_fixture(args.fixture)))
+    print(f'Serving GitHub GraphQL fixture on http://{args.host}:{args.port}/graphql')
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+GitHub issue counts for analytics.metrics in one batched GraphQL request.
+
+Every repo is one aliased `repository { issues { totalCount } }` field in a
+single GraphQL document, so counts are exact at any issue volume and cost one
+round trip. The response is cached under .cache/ with its ETag; the next
+request sends If-None-Match and reuses the cached counts on 304 Not Modified,
+or when the API cannot be reached.
+
+Authentication uses GITHUB_TOKEN / GH_TOKEN, falling back to `gh auth token`.
+Set GITHUB_GRAPHQL_URL to point at github_fixture_server.py for offline runs.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import urllib.error
+import urllib.request
+
+from .git_history import CACHE_DIR
+from .tracing import span, subprocess_span
+
+GRAPHQL_URL = os.environ.get('GITHUB_GRAPHQL_URL', 'https://api.github.com/graphql')
+CACHE_PATH = CACHE_DIR / 'github_issues.json'
+REQUEST_TIMEOUT = 30
+
+
+def build_query(slugs):
+    """GraphQL document with one aliased issue-count field per owner/repo slug."""
+    fields = []
+    for i, slug in enumerate(slugs):
+        owner, name = slug.split('/', 1)
+        fields.append(f'r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) '
+                      '{ issues { totalCount } }')
+    return 'query { ' + ' '.join(fields) + ' }'
+
+
+def get_token():
+    """GitHub token from the environment or the gh CLI, or None."""
+    token = os.environ.get('GITHUB_TOKEN') or os.environ.get('GH_TOKEN')
+    if token:
+        return token
+    cmd = ['gh', 'auth', 'token']
+    try:
+        with subprocess_span(cmd):
+            r = subprocess.run(cmd, capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+    return r.stdout.strip() if r.returncode == 0 and r.stdout.strip() else None
+
+
+def _load_cache():
+    try:
+        return json.loads(CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_PATH.with_suffix('.tmp')
+    tmp.write_text(json.dumps(cache, indent=2))
+    os.replace(tmp, CACHE_PATH)
+
+
+def _post(query, etag=None):
+    """POST a GraphQL query; return (status, etag, parsed body or None)."""
+    headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+    token = get_token()
+    if token:
+        headers['Authorization'] = f'bearer {token}'
+    if etag:
+        headers['If-None-Match'] = etag
+    req = urllib.request.Request(GRAPHQL_URL, data=json.dumps({'query': query}).encode(),
+                                 headers=headers, method='POST')
+    try:
+        with span('GitHub GraphQL', cat='http', url=GRAPHQL_URL), \
+                urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as resp:
+            return resp.status, resp.headers.get('ETag'), json.load(resp)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return 304, etag, None
+        raise
+
+
+def fetch_issue_counts(gh_repos):
+    """Return {name: total issues (all states)} for a {name: 'owner/repo'} map.
+
+    Falls back to the last cached counts if the request fails, and to 0 for
+    repos that have never been fetched.
+    """
+    slugs = list(dict.fromkeys(gh_repos.values()))
+    query = build_query(slugs)
+    key = hashlib.sha256(f'{GRAPHQL_URL}\n{query}'.encode()).hexdigest()
+    cache = _load_cache()
+    cached = cache.get(key)
+
+    counts = None
+    try:
+        status, etag, body = _post(query, cached and cached.get('etag'))
+        if status == 304:
+            counts = cached['counts']
+        else:
+            data = body.get('data') or {}
+            if body.get('errors') and not data:
+                raise ValueError(body['errors'][0].get('message', 'GraphQL error'))
+            counts = {slug: ((data.get(f'r{i}') or {}).get('issues') or {}).get('totalCount', 0)
+                      for i, slug in enumerate(slugs)}
+            cache[key] = {'etag': etag, 'counts': counts}
+            _save_cache(cache)
+    except (OSError, ValueError) as e:
+        if cached:
+            print(f'  WARNING: GitHub query failed ({e}), using cached issue counts')
+            counts = cached['counts']
+        else:
+            print(f'  WARNING: GitHub query failed ({e}), issue counts unavailable')
+            counts = {}
+    return {name: counts.get(slug, 0) for name, slug in gh_repos.items()}
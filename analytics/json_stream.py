@@ -0,0 +1,112 @@
+"""
+Incremental reader for large JSON files.
+
+JSONStream walks a file one value at a time instead of loading it whole:
+items() iterates over an object's keys and array() over an array's
+elements. The caller consumes each key's value or element with value(),
+or descends with items()/array(), before asking for the next one. Memory
+is bounded by the read chunk plus about twice the largest single value
+decoded, not by the file size.
+
+    with open(path) as f:
+        stream = JSONStream(f)
+        for sha in stream.items():
+            samples = stream.value()
+"""
+
+import json
+
+CHUNK_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+_NUMBER_CHARS = '0123456789+-.eE'
+
+
+class JSONStream:
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size=None):
+        """Read another chunk, dropping what has been consumed. False at EOF."""
+        if self._eof:
+            return False
+        chunk = self._f.read(size or self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        """The next non-whitespace character ('' at EOF), without consuming it."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, chars):
+        ch = self._peek()
+        if ch not in chars:
+            raise ValueError(f'expected {chars!r}, found {ch or "end of file"!r}')
+        self._pos += 1
+        return ch
+
+    def value(self):
+        """Decode the next complete JSON value.
+
+        A value that does not fit the buffer is retried after reading twice
+        as much as the previous attempt, so decoding a large value costs
+        O(size) in total rather than one full re-decode per chunk.
+        """
+        self._peek()
+        size = self._chunk_size
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            # A number cut by the end of the buffer ("3." or "1e") may continue in
+            # the next chunk
+            if (isinstance(obj, (int, float)) and not isinstance(obj, bool)
+                    and not self._buf[end:].lstrip(_NUMBER_CHARS) and self._fill(size)):
+                size *= 2
+                continue
+            self._pos = end
+            return obj
+
+    def items(self):
+        """Yield the keys of the next object; consume each value before resuming."""
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError(f'object key must be a string, found {key!r}')
+            self._expect(':')
+            yield key
+            if self._expect(',}') == '}':
+                return
+
+    def array(self):
+        """Yield once per element of the next array; consume each before resuming."""
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield
+            if self._expect(',]') == ']':
+                return
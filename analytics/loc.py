@@ -0,0 +1,131 @@
+"""
+Blob line counting shared by the metrics and chart generators.
+
+Streams blob contents through one `git cat-file --batch` process per repo,
+counting newlines on the raw buffers (same semantics as `wc -l`). Blobs are
+read in fixed-size chunks, so memory stays bounded however large the repo or
+its files are, and no file list is ever passed on a command line.
+
+Counts are content-addressed: a persistent blob SHA -> line count map under
+.cache/ is shared by every repo, so only blobs never seen before are read.
+Unchanged files, and files vendored into several repos, cost nothing.
+"""
+
+import os
+import pickle
+import subprocess
+import threading
+
+from .git_history import CACHE_DIR
+from .repo_pool import remaining
+from .tracing import subprocess_span
+
+CHUNK_SIZE = 1 << 20
+BLOB_CACHE_PATH = CACHE_DIR / 'blob_lines.pickle'
+
+_blob_lines = None
+_blob_lines_dirty = False
+_blob_lines_lock = threading.Lock()
+
+
+def count_blob_lines(repo_path, shas):
+    """Return {sha: newline count} for the given blobs via `git cat-file --batch`."""
+    shas = list(dict.fromkeys(shas))
+    if not shas:
+        return {}
+    cmd = ['git', '-C', repo_path, 'cat-file', '--batch']
+    with subprocess_span(cmd):
+        return _read_batch(cmd, shas)
+
+
+def _read_batch(cmd, shas):
+    counts = {}
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL)
+
+    # Feed requests from a separate thread so a full stdout pipe can't deadlock us
+    def feed():
+        try:
+            for sha in shas:
+                proc.stdin.write(f'{sha}\n'.encode())
+            proc.stdin.close()
+        except (BrokenPipeError, ValueError):
+            pass
+
+    budget = remaining()
+    timer = threading.Timer(budget, proc.kill) if budget is not None else None
+    writer = threading.Thread(target=feed, daemon=True)
+    writer.start()
+    if timer:
+        timer.start()
+    try:
+        out = proc.stdout
+        for _ in shas:
+            header = out.readline().split()
+            if len(header) < 3:  # '<sha> missing' or stream ended
+                if not header:
+                    break
+                continue
+            sha, size = header[0].decode(), int(header[2])
+            lines = 0
+            while size > 0:
+                chunk = out.read(min(size, CHUNK_SIZE))
+                if not chunk:
+                    break
+                lines += chunk.count(b'\n')
+                size -= len(chunk)
+            out.read(1)  # record terminator
+            counts[sha] = lines
+    finally:
+        if timer:
+            timer.cancel()
+        proc.stdout.close()
+        proc.wait()
+        writer.join()
+    if timer and proc.returncode < 0:
+        raise subprocess.TimeoutExpired(cmd, budget)
+    return counts
+
+
+def _blob_cache():
+    """Return the shared blob SHA -> line count map, loading it on first use."""
+    global _blob_lines
+    with _blob_lines_lock:
+        if _blob_lines is None:
+            try:
+                with open(BLOB_CACHE_PATH, 'rb') as f:
+                    _blob_lines = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                _blob_lines = {}
+        return _blob_lines
+
+
+def save_blob_cache():
+    """Persist the blob line-count map if any new blobs were counted."""
+    global _blob_lines_dirty
+    with _blob_lines_lock:
+        if _blob_lines is None or not _blob_lines_dirty:
+            return
+        BLOB_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = BLOB_CACHE_PATH.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            pickle.dump(_blob_lines, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, BLOB_CACHE_PATH)
+        _blob_lines_dirty = False
+
+
+def blob_line_counts(repo_path, shas):
+    """Return {sha: line count} for blobs in repo_path.
+
+    Only blobs missing from the shared line-count cache are read from git;
+    call save_blob_cache() once all repos are done.
+    """
+    global _blob_lines_dirty
+    cache = _blob_cache()
+    missing = [sha for sha in shas if sha not in cache]
+    if missing:
+        counts = count_blob_lines(repo_path, missing)
+        with _blob_lines_lock:
+            cache.update(counts)
+            _blob_lines_dirty = True
+    return cache
@@ -0,0 +1,204 @@
+"""
+Auto-generate metrics.tex from live git and GitHub data.
+
+Reads the shared repo aggregates (aggregates.py) and queries the GitHub API
+to produce LaTeX \newcommand definitions. The paper uses \\input{metrics.tex}
+and these commands instead of hardcoded numbers, ensuring every build has
+fresh data.
+
+Standards: NIST SP 800-53 CM-3 (configuration change control)
+"""
+
+import argparse
+import re
+from pathlib import Path
+from datetime import datetime, timezone
+
+from . import tracing
+from .aggregates import load_aggregates
+from .github_issues import fetch_issue_counts
+from .prepare import prepare_repos
+from .repo_pool import run
+from .repos import load_repos, measured_repos
+from .tracing import span
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+def count_sessions():
+    """Count sessions from PROCESS.md."""
+    process_file = REPO_DIR / 'PROCESS.md'
+    if not process_file.exists():
+        return 0
+    count = 0
+    for line in process_file.read_text().split('\n'):
+        if line.startswith('## Session '):
+            count += 1
+    return count
+
+
+def lang_command(lang):
+    """LaTeX command name for a language's LOC, e.g. C# -> \\locCSharp."""
+    return '\\loc' + re.sub(r'[^A-Za-z]', '', lang.replace('#', 'Sharp'))
+
+
+def fmt_number(n):
+    """Format number with commas for LaTeX."""
+    return f'{n:,}'
+
+
+def fmt_number_approx(n):
+    """Format as approximate (round to nearest thousand)."""
+    thousands = (n // 1000) * 1000
+    return f'{fmt_number(thousands)}+'
+
+
+def summarize(aggregates, issue_counts):
+    """Ecosystem, measured-set and per-repo figures used by metrics.tex."""
+    eco = aggregates['ecosystem']
+    measured = aggregates['measured']
+    repos = aggregates['repos']
+    sec = repos.get('Security Toolkit', {})
+    wp = repos.get('WhitePaper', {})
+    return {
+        # Totals
+        'total_repos': eco['repos'],
+        'total_commits': eco['commits'],
+        'total_loc': eco['loc'],
+        'total_tags': eco['tags'],
+        'total_langs': eco['languages'],
+        'loc_by_lang': eco['loc_by_lang'],
+        'calendar_days': eco['calendar_days'],
+        'daily_rate': eco['daily_rate'],
+        # Measured set totals
+        'measured_repos': measured['repos'],
+        'measured_commits': measured['commits'],
+        'measured_loc': measured['loc'],
+        'measured_tags': measured['tags'],
+        # Security Toolkit specifics
+        'sec_commits': sec.get('commits', 0),
+        'sec_tags': sec.get('tags', 0),
+        'sec_loc': sec.get('loc', 0),
+        # WhitePaper repo specifics
+        'wp_commits': wp.get('commits', 0),
+        'wp_tags': wp.get('tags', 0),
+        # GitHub issue counts
+        'github_repos': len(issue_counts),
+        'total_issues': sum(issue_counts.values()),
+        'wp_issues': issue_counts.get('WhitePaper', 0),
+        'sec_issues': issue_counts.get('Security Toolkit', 0),
+    }
+
+
+def metrics_lines(m, wp_sessions, wp_commit_hash):
+    """Lines of metrics.tex for the summarized metrics m."""
+    return [
+        '% AUTO-GENERATED — do not edit manually.',
+        f'% Generated by generate_metrics.py on {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")}',
+        f'% Source: {m["total_repos"]} git repos, {m["github_repos"]} GitHub repos queried',
+        '%',
+        '% Ecosystem totals',
+        f'\\newcommand{{\\totalrepos}}{{{fmt_number(m["total_repos"])}}}',
+        f'\\newcommand{{\\totalcommits}}{{{fmt_number(m["total_commits"])}}}',
+        f'\\newcommand{{\\totalloc}}{{{fmt_number_approx(m["total_loc"])}}}',
+        f'\\newcommand{{\\totaltags}}{{{fmt_number(m["total_tags"])}}}',
+        f'\\newcommand{{\\totallangs}}{{{m["total_langs"]}}}',
+        f'\\newcommand{{\\calendardays}}{{{m["calendar_days"]}}}',
+        f'\\newcommand{{\\dailyrate}}{{{m["daily_rate"]}}}',
+        f'\\newcommand{{\\totalissues}}{{{fmt_number(m["total_issues"])}}}',
+        '%',
+        '% Measured set (7 core repos)',
+        f'\\newcommand{{\\measuredrepos}}{{{m["measured_repos"]}}}',
+        f'\\newcommand{{\\measuredcommits}}{{{fmt_number(m["measured_commits"])}}}',
+        f'\\newcommand{{\\measuredloc}}{{{fmt_number(m["measured_loc"])}}}',
+        f'\\newcommand{{\\measuredtags}}{{{fmt_number(m["measured_tags"])}}}',
+        '%',
+        '% Security Toolkit',
+        f'\\newcommand{{\\seccommits}}{{{fmt_number(m["sec_commits"])}}}',
+        f'\\newcommand{{\\sectags}}{{{m["sec_tags"]}}}',
+        f'\\newcommand{{\\secloc}}{{{fmt_number(m["sec_loc"])}}}',
+        f'\\newcommand{{\\secissues}}{{{fmt_number(m["sec_issues"])}}}',
+        '%',
+        '% WhitePaper repo',
+        f'\\newcommand{{\\wpcommits}}{{{m["wp_commits"]}}}',
+        f'\\newcommand{{\\wptags}}{{{m["wp_tags"]}}}',
+        f'\\newcommand{{\\wpissues}}{{{m["wp_issues"]}}}',
+        f'\\newcommand{{\\wpsessions}}{{{wp_sessions}}}',
+        f'\\newcommand{{\\wpcommithash}}{{{wp_commit_hash}}}',
+        '%',
+        '% Lines of code by language (all repos)',
+    ] + [
+        f'\\newcommand{{{lang_command(lang)}}}{{{fmt_number(n)}}}'
+        for lang, n in m['loc_by_lang'].items()
+    ]
+
+
+def write_metrics(lines, metrics_path):
+    with span('write metrics.tex'):
+        metrics_path.write_text('\n'.join(lines) + '\n')
+    print(f'  Saved: {metrics_path}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate metrics.tex from live git and GitHub data.')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of repos to process concurrently (default: 1)')
+    parser.add_argument('--timeout', type=float, default=None,
+                        help='per-repo time budget in seconds; slower repos are skipped')
+    parser.add_argument('--prepare', action='store_true',
+                        help='first write missing or stale commit-graphs (see analytics.prepare)')
+    parser.add_argument('--trace', metavar='PATH', default=None,
+                        help='append Chrome trace events to PATH (same as WHITEPAPER_TRACE=PATH)')
+    args = parser.parse_args(argv)
+    if args.trace:
+        tracing.enable(args.trace)
+
+    print('Generating metrics.tex from live data...')
+
+    # Per-repo data, shared with the charts through the aggregates artifact
+    repos = load_repos()
+    if args.prepare:
+        prepare_repos(repos.all, args.jobs, args.timeout)
+    aggregates = load_aggregates(repos.all, args.jobs, args.timeout)
+    for name, d in aggregates['repos'].items():
+        print(f'  {name:25s} {d["commits"]:4d} commits  {d["loc"]:>8,} LOC  {d["tags"]:3d} tags')
+
+    # GitHub issue counts
+    print('\nQuerying GitHub issues...')
+    with span('GitHub issues'):
+        issue_counts = fetch_issue_counts(repos.github)
+    for name, count in issue_counts.items():
+        print(f'  {name:25s} {count:4d} issues')
+
+    with span('summarize'):
+        m = summarize(aggregates, issue_counts)
+        wp_sessions = count_sessions()
+
+    # WhitePaper git commit hash (short)
+    wp_path = measured_repos(repos).get('WhitePaper', '')
+    r = run(['git', '-C', wp_path, 'rev-parse', '--short', 'HEAD'])
+    wp_commit_hash = r.stdout.strip() if r.returncode == 0 else 'unknown'
+
+    # ========================================================================
+    # Generate metrics.tex
+    # ========================================================================
+    print(f'\nWriting metrics.tex...')
+    write_metrics(metrics_lines(m, wp_sessions, wp_commit_hash), REPO_DIR / 'metrics.tex')
+
+    # Summary
+    print(f'\n=== Metrics Summary ===')
+    print(f'  Ecosystem: {m["total_repos"]} repos, {m["total_commits"]} commits, '
+          f'{m["total_loc"]:,} LOC, {m["total_tags"]} tags')
+    print(f'  Measured:  {m["measured_repos"]} repos, {m["measured_commits"]} commits, '
+          f'{m["measured_loc"]:,} LOC, {m["measured_tags"]} tags')
+    print(f'  Security:  {m["sec_commits"]} commits, {m["sec_loc"]:,} LOC, '
+          f'{m["sec_tags"]} tags, {m["sec_issues"]} issues')
+    print(f'  WhitePaper: {m["wp_commits"]} commits, {m["wp_tags"]} tags, '
+          f'{m["wp_issues"]} issues, {wp_sessions} sessions')
+    print(f'  Period:    {m["calendar_days"]} days, {m["daily_rate"]} commits/day')
+    print(f'  Issues:    {m["total_issues"]} total across {m["github_repos"]} repos')
+    print(f'  Languages: ' + ', '.join(f'{lang} {n:,}' for lang, n in m['loc_by_lang'].items() if n))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+"""
+Optional repository preparation: commit-graph files with Bloom filters.
+
+Without a commit-graph, every `git rev-list --all`, `git log --all` and
+path-limited log parses each commit object from the packs. A commit-graph
+stores parents, trees and generation numbers in one indexed file, and its
+changed-path Bloom filters let path-limited walks skip most tree diffs.
+
+prepare_repos() checks each repo's graph and writes one only when needed:
+
+  missing   no commit-graph file: write one for every reachable commit
+  no-bloom  a graph without changed-path filters: rewrite it with them
+  stale     some ref tips are not in the graph: add a layer for the new
+            commits (--split), leaving the existing layers as they are
+  fresh     every ref tip is covered, with filters: nothing to do
+
+The check reads the graph files directly (chunk table and OID lookup) and
+runs one for-each-ref, so it costs milliseconds on a prepared repo.
+Writing goes through `git commit-graph write --reachable`, which adds files
+under objects/info and never touches refs, the index or the packs. Bare
+mirrors work the same as checkouts. In partial clones git may not fetch
+missing objects while writing. A tree-less clone (--filter=tree:0) gets a
+graph without Bloom filters, which would need trees it does not have;
+blob:none clones have every tree and get full filters.
+
+    python3 -m analytics.prepare --jobs 8    # prepare every present repo
+    python3 -m analytics.prepare --check     # report only
+"""
+
+import argparse
+import mmap
+import os
+from bisect import bisect_left
+from pathlib import Path
+
+from . import tracing
+from .repo_pool import git, map_repos
+from .repos import load_repos, present_repos
+from .tracing import span
+
+GRAPH_SIGNATURE = b'CGPH'
+HASH_SIZES = {1: 20, 2: 32}  # commit-graph hash version -> object id bytes
+
+# Never let a write fetch from a promisor remote (git 2.44+; ignored before)
+_NO_FETCH_ENV = {**os.environ, 'GIT_NO_LAZY_FETCH': '1'}
+
+
+class GraphLayer:
+    """One commit-graph file: its chunk ids and sorted commit ids."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        data = self._map
+        if data[:4] != GRAPH_SIGNATURE or data[5] not in HASH_SIZES:
+            raise ValueError(f'{path}: not a commit-graph file')
+        self.hash_size = HASH_SIZES[data[5]]
+        chunks = {}
+        for i in range(data[6]):
+            entry = 8 + 12 * i
+            chunks[data[entry:entry + 4].decode('ascii', 'replace')] = \
+                int.from_bytes(data[entry + 4:entry + 12], 'big')
+        self.chunks = set(chunks)
+        self.count = int.from_bytes(data[chunks['OIDF'] + 1020:chunks['OIDF'] + 1024], 'big')
+        self._oids = chunks['OIDL']
+
+    @property
+    def bloom(self):
+        return {'BIDX', 'BDAT'} <= self.chunks
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        start = self._oids + i * self.hash_size
+        return self._map[start:start + self.hash_size]
+
+    def __contains__(self, oid):
+        i = bisect_left(self, oid)
+        return i < self.count and self[i] == oid
+
+    def close(self):
+        self._map.close()
+
+
+def objects_dir(repo_path):
+    r = git(repo_path, 'rev-parse', '--git-path', 'objects')
+    if r.returncode != 0:
+        raise RuntimeError(r.stderr.strip() or 'not a git repository')
+    return Path(repo_path) / r.stdout.strip()
+
+
+def graph_paths(repo_path):
+    """The commit-graph files git would read: the single file, else the split chain."""
+    info = objects_dir(repo_path) / 'info'
+    if (info / 'commit-graph').is_file():
+        return [info / 'commit-graph']
+    chain = info / 'commit-graphs' / 'commit-graph-chain'
+    if not chain.is_file():
+        return []
+    return [chain.parent / f'graph-{h}.graph' for h in chain.read_text().split()]
+
+
+def ref_commits(repo_path):
+    """Commit ids of the ref tips, with annotated tags peeled."""
+    r = git(repo_path, 'for-each-ref',
+            '--format=%(objecttype) %(objectname) %(*objecttype) %(*objectname)')
+    commits = set()
+    for line in r.stdout.split('\n'):
+        fields = line.split()
+        if len(fields) >= 2 and fields[0] == 'commit':
+            commits.add(fields[1])
+        elif len(fields) == 4 and fields[2] == 'commit':
+            commits.add(fields[3])
+    return commits
+
+
+def tree_less(repo_path):
+    """True for a partial clone that filters out trees (tree:<depth>)."""
+    r = git(repo_path, 'config', '--get-regexp', r'^remote\..*\.partialclonefilter$')
+    return any(line.split(maxsplit=1)[-1].startswith('tree:')
+               for line in r.stdout.split('\n') if line)
+
+
+def graph_state(repo_path, bloom=True):
+    """'missing', 'no-bloom', 'stale' or 'fresh' (see the module docstring)."""
+    paths = graph_paths(repo_path)
+    if not paths or not all(p.is_file() for p in paths):
+        return 'missing'
+    layers = [GraphLayer(p) for p in paths]
+    try:
+        if bloom and not all(layer.bloom for layer in layers):
+            return 'no-bloom'
+        for tip in ref_commits(repo_path):
+            oid = bytes.fromhex(tip)
+            if not any(oid in layer for layer in layers):
+                return 'stale'
+        return 'fresh'
+    finally:
+        for layer in layers:
+            layer.close()
+
+
+def write_graph(repo_path, split=False, bloom=True):
+    args = ['-c', 'core.commitGraph=true', 'commit-graph', 'write', '--reachable', '--no-progress']
+    if bloom:
+        args.append('--changed-paths')
+    if split:
+        args.append('--split')
+    r = git(repo_path, *args, env=_NO_FETCH_ENV)
+    if r.returncode != 0:
+        raise RuntimeError(r.stderr.strip() or 'git commit-graph write failed')
+
+
+def prepare_repo(path, check=False):
+    """(state before, action taken) for one repo; action is None when nothing ran."""
+    bloom = not tree_less(path)
+    state = graph_state(path, bloom)
+    if check or state == 'fresh':
+        return state, None
+    # A stale graph that already has filters only needs a layer for new commits
+    split = state == 'stale'
+    write_graph(path, split=split, bloom=bloom)
+    return state, 'extended' if split else 'written'
+
+
+def prepare_repos(repos, jobs=1, timeout=None, check=False):
+    """Prepare every present repo in {name: path}; returns {name: (state, action)}."""
+    with span('prepare repos', jobs=jobs, check=check):
+        return map_repos(lambda name, path: prepare_repo(path, check),
+                         present_repos(repos), jobs, timeout)
+
+
+def report(results):
+    for name, (state, action) in results.items():
+        print(f'  {name:25s} {state:8s} {action or ""}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Write commit-graph files with Bloom filters where missing or stale.')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of repos to process concurrently (default: 1)')
+    parser.add_argument('--timeout', type=float, default=None,
+                        help='per-repo time budget in seconds; slower repos are skipped')
+    parser.add_argument('--check', action='store_true',
+                        help='only report each graph\'s state, write nothing')
+    parser.add_argument('--path', action='append', default=None,
+                        help='prepare this repo instead of the manifest (repeatable)')
+    parser.add_argument('--trace', metavar='PATH', default=None,
+                        help='append Chrome trace events to PATH (same as WHITEPAPER_TRACE=PATH)')
+    args = parser.parse_args(argv)
+    if args.trace:
+        tracing.enable(args.trace)
+
+    repos = {p: p for p in args.path} if args.path else load_repos().all
+    results = prepare_repos(repos, args.jobs, args.timeout, args.check)
+    report(results)
+    if args.check:
+        needed = sum(state != 'fresh' for state, _ in results.values())
+        print(f'  {len(results)} repos checked, {needed} need a commit-graph write')
+    else:
+        written = sum(action is not None for _, action in results.values())
+        print(f'  {len(results)} repos checked, {written} commit-graphs written')
+
+
+if __name__ == '__main__':
+    main()
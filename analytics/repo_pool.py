@@ -0,0 +1,143 @@
+"""
+Bounded worker pool for per-repo work in the metrics and chart generators.
+
+map_repos() runs a function over every repo on up to `jobs` threads and
+returns the results in the order of the input dict, regardless of which
+worker finishes first. Each repo gets its own time budget: run() and git()
+pass the remaining budget as the subprocess timeout, so a hung repo is killed
+and skipped instead of stalling the whole build.
+
+Threads rather than processes: the work is dominated by git subprocesses,
+so threads overlap it without pickling results between processes.
+"""
+
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .tracing import span, subprocess_span
+
+_local = threading.local()
+
+
+def remaining():
+    """Seconds left in the calling repo's time budget, or None if unbounded."""
+    deadline = getattr(_local, 'deadline', None)
+    return None if deadline is None else max(deadline - time.monotonic(), 0.001)
+
+
+def run(cmd, input=None, env=None):
+    """Run a command within the calling repo's time budget (if any)."""
+    with subprocess_span(cmd):
+        return subprocess.run(cmd, input=input, capture_output=True, text=True,
+                              timeout=remaining(), env=env)
+
+
+def git(repo_path, *args, input=None, env=None):
+    """Run `git -C repo_path <args>` within the calling repo's time budget."""
+    return run(['git', '-C', repo_path, *args], input=input, env=env)
+
+
+def stream(cmd, input=None, chunk_size=1 << 16):
+    """Yield a command's stdout as bytes chunks, within the repo's time budget.
+
+    Output is never accumulated, so memory stays flat however much the
+    command prints. Closing the generator early kills the command. A command
+    that exits non-zero raises CommandError once its output is exhausted, so
+    a truncated stream is never mistaken for a complete one.
+    """
+    with subprocess_span(cmd):
+        yield from _stream(cmd, input, chunk_size)
+
+
+class CommandError(subprocess.CalledProcessError):
+    """A streamed command exited non-zero; the message includes its stderr."""
+
+    def __str__(self):
+        detail = '; '.join(line for line in (self.stderr or '').splitlines() if line.strip())
+        return f'{super().__str__().rstrip(".")}: {detail}' if detail else super().__str__()
+
+
+def _stream(cmd, input, chunk_size):
+    # stderr goes to a file rather than a pipe, so a chatty command cannot
+    # block on it while stdout is being read
+    errors = tempfile.TemporaryFile()
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=errors,
+                            stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL)
+
+    def feed():
+        try:
+            proc.stdin.write(input.encode())
+            proc.stdin.close()
+        except (BrokenPipeError, ValueError):
+            pass
+
+    expired = threading.Event()
+
+    def expire():
+        expired.set()
+        proc.kill()
+
+    budget = remaining()
+    timer = threading.Timer(budget, expire) if budget is not None else None
+    writer = threading.Thread(target=feed, daemon=True) if input is not None else None
+    if writer:
+        writer.start()
+    if timer:
+        timer.start()
+    finished = False
+    try:
+        while chunk := proc.stdout.read1(chunk_size):
+            yield chunk
+        finished = True
+    finally:
+        if timer:
+            timer.cancel()
+        if not finished and proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
+        if writer:
+            writer.join()
+        errors.seek(0)
+        stderr = errors.read().decode('utf-8', 'replace')
+        errors.close()
+    if expired.is_set():
+        raise subprocess.TimeoutExpired(cmd, budget)
+    if proc.returncode != 0:
+        raise CommandError(proc.returncode, cmd, stderr=stderr)
+
+
+def git_stream(repo_path, *args, input=None):
+    """Stream the stdout of `git -C repo_path <args>` (see stream())."""
+    return stream(['git', '-C', repo_path, *args], input=input)
+
+
+def map_repos(func, repos, jobs=1, timeout=None):
+    """Call func(name, path) for each repo and return {name: result}.
+
+    Results keep the order of `repos`. A repo that raises or runs past
+    `timeout` seconds is reported and left out of the result.
+    """
+    def task(name, path):
+        _local.deadline = time.monotonic() + timeout if timeout else None
+        try:
+            with span(name, cat='repo', task=func.__name__):
+                return func(name, path)
+        finally:
+            _local.deadline = None
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = {name: pool.submit(task, name, path) for name, path in repos.items()}
+
+    results = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except subprocess.TimeoutExpired:
+            print(f'  WARNING: {name} exceeded {timeout}s budget, skipped')
+        except Exception as e:
+            print(f'  WARNING: {name} failed ({e}), skipped')
+    return results
@@ -0,0 +1,149 @@
+"""
+The repositories measured by the paper, shared by every generator.
+
+The repo set comes from a JSON manifest: repos.json at the repo root, or the
+file named by WHITEPAPER_REPOS. It lists repos by name, and may also scan
+root directories for git repos:
+
+    {
+      "repos": {
+        "WhitePaper": {"path": "~/WhitePaper", "group": "measured",
+                       "github": "brucedombrowski/WhitePaper"}
+      },
+      "scan": [
+        {"root": "/srv/mirrors", "depth": 2, "include": ["org/*"],
+         "exclude": ["*/archive-*"], "group": "extra", "github": "{name}"}
+      ]
+    }
+
+Paths may use ~ and are resolved relative to the manifest. A scan finds
+checkouts and bare repos up to `depth` directories below `root`. It names
+each repo by its path relative to root and keeps the ones matching an
+`include` glob and no `exclude` glob. `github` is a slug template over
+{name} and {dirname}. Scanning only lists directories, so discovering
+hundreds of repos costs milliseconds. Explicit entries win over scanned
+repos with the same name.
+
+Groups: "measured" is the core case-study set reported in the paper, and
+"extra" completes the ecosystem totals. Any other group name is allowed and
+counts toward the ecosystem.
+
+    python3 -m analytics.repos    # list the discovered repos
+"""
+
+import argparse
+import json
+import os
+from collections import namedtuple
+from fnmatch import fnmatch
+from functools import lru_cache
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = Path(os.environ.get('WHITEPAPER_REPOS', REPO_DIR / 'repos.json'))
+
+# all: {name: path} in manifest order (listed repos, then scanned ones by name);
+# groups: {group: {name: path}}; github: {name: owner/repo} for issue counting
+RepoSet = namedtuple('RepoSet', 'all groups github')
+
+
+def is_git_repo(path):
+    """True for a checkout (.git directory or file) or a bare repository."""
+    path = Path(path)
+    return ((path / '.git').exists()
+            or ((path / 'HEAD').is_file() and (path / 'objects').is_dir() and (path / 'refs').is_dir()))
+
+
+def scan_root(root, depth=1, include=('*',), exclude=()):
+    """{relative name: path} for the git repos up to depth levels below root.
+
+    Does not descend into repos it finds (submodules and nested checkouts are
+    not listed separately) or into hidden directories.
+    """
+    found = {}
+    pending = [(Path(root), '', 0)]
+    while pending:
+        directory, prefix, level = pending.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.is_dir():
+                continue
+            name = f'{prefix}{entry.name}'
+            if is_git_repo(entry.path):
+                if (any(fnmatch(name, pattern) for pattern in include)
+                        and not any(fnmatch(name, pattern) for pattern in exclude)):
+                    found[name] = entry.path
+            elif level + 1 < depth:
+                pending.append((Path(entry.path), f'{name}/', level + 1))
+    return dict(sorted(found.items()))
+
+
+def _resolve(path, base):
+    return str((base / Path(path).expanduser()).resolve())
+
+
+def parse_manifest(manifest, base=REPO_DIR):
+    """RepoSet from a parsed manifest; relative paths are resolved against base."""
+    all_repos, groups, github = {}, {}, {}
+
+    def add(name, path, group, slug):
+        all_repos[name] = path
+        groups.setdefault(group, {})[name] = path
+        if slug:
+            github[name] = slug
+
+    for name, entry in manifest.get('repos', {}).items():
+        if isinstance(entry, str):
+            entry = {'path': entry}
+        add(name, _resolve(entry['path'], base), entry.get('group', 'extra'), entry.get('github'))
+
+    for scan in manifest.get('scan', []):
+        found = scan_root(_resolve(scan['root'], base), scan.get('depth', 1),
+                          scan.get('include', ['*']), scan.get('exclude', []))
+        for name, path in found.items():
+            if name not in all_repos:
+                slug = scan.get('github')
+                add(name, path, scan.get('group', 'extra'),
+                    slug.format(name=name, dirname=Path(path).name) if slug else None)
+    return RepoSet(all_repos, groups, github)
+
+
+@lru_cache(maxsize=None)
+def load_repos(manifest_path=MANIFEST_PATH):
+    """The RepoSet defined by the manifest (read once per process)."""
+    manifest_path = Path(manifest_path)
+    return parse_manifest(json.loads(manifest_path.read_text()), manifest_path.parent)
+
+
+def measured_repos(repos=None):
+    """{name: path} of the core case-study set."""
+    return (repos or load_repos()).groups.get('measured', {})
+
+
+def present_repos(repos):
+    """The repos in {name: path} that are git repositories on this machine."""
+    return {name: path for name, path in repos.items() if is_git_repo(path)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='List the repos defined by the repo manifest.')
+    parser.add_argument('--manifest', type=Path, default=MANIFEST_PATH,
+                        help=f'repo manifest (default: {MANIFEST_PATH}, or WHITEPAPER_REPOS)')
+    args = parser.parse_args(argv)
+
+    repos = load_repos(args.manifest)
+    present = present_repos(repos.all)
+    for group, members in repos.groups.items():
+        print(f'{group} ({len(members)}):')
+        for name, path in members.items():
+            slug = f'  [{repos.github[name]}]' if name in repos.github else ''
+            mark = '' if name in present else '  (missing)'
+            print(f'  {name:25s} {path}{slug}{mark}')
+    print(f'{len(repos.all)} repos, {len(present)} present, {len(repos.github)} on GitHub')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+"""
+Kaplan-Meier survival of lines of code from birth, death and censoring events.
+
+A commit's lines are born when it is first sampled. Lines die at the sample
+where they are no longer attributed to that commit. Lines still alive at the
+commit's last sample are censored there. Events are weighted by line count,
+so a commit contributes one event per sample in which some of its lines
+died, not one per line. Nothing is padded into a commits x days matrix.
+
+SurvivalAccumulator bins these events by day while commits stream in (see
+json_stream.py) and builds the estimator and Greenwood log-log confidence
+bands from cumulative sums, along with the per-commit mean and percentile
+curves.
+"""
+
+from collections import namedtuple
+from itertools import chain
+from statistics import NormalDist
+
+import numpy as np
+
+# Step function: survival[i] holds from time[i] until time[i + 1]
+Survival = namedtuple('Survival', 'time survival lower upper at_risk')
+
+
+def _estimate(times, deaths, leaving, alpha):
+    """Kaplan-Meier step function from per-time death and death+censoring weights."""
+    at_risk = leaving[::-1].cumsum()[::-1]  # still alive just before each time
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hazard = np.where(at_risk > 0, deaths / at_risk, 0.0)
+        survival = np.cumprod(1.0 - hazard)
+        # Greenwood: Var(S) / S^2 = sum d / (n (n - d))
+        greenwood = np.cumsum(np.where(at_risk > deaths, deaths / (at_risk * (at_risk - deaths)),
+                                       0.0))
+        log_s = np.log(survival)
+        z = NormalDist().inv_cdf(1 - alpha / 2)
+        se = np.sqrt(greenwood) / np.abs(log_s)
+        lower = np.where((survival > 0) & (survival < 1), survival ** np.exp(z * se), survival)
+        upper = np.where((survival > 0) & (survival < 1), survival ** np.exp(-z * se), survival)
+
+    # Survival is 1 from time 0 until the first event
+    if not len(times) or times[0] > 0:
+        times = np.concatenate([[0.0], times])
+        survival, lower, upper = (np.concatenate([[1.0], a]) for a in (survival, lower, upper))
+        at_risk = np.concatenate([[at_risk[0] if len(at_risk) else 0.0], at_risk])
+    return Survival(times, survival, lower, upper, at_risk)
+
+
+class SurvivalAccumulator:
+    """Running survival aggregates over commits, fed one commit at a time.
+
+    Commits are buffered and folded in with vectorized batches of about
+    batch_size samples. Events are binned to `resolution` days. Each
+    commit's daily fraction surviving, relative to its first sample, feeds a
+    running mean and a fixed-bin histogram per day; percentiles are read from
+    the histogram. Memory grows with the longest series and the batch size,
+    not with the number of commits.
+    """
+
+    def __init__(self, resolution=1.0, bins=100, batch_size=1 << 16):
+        self.resolution = resolution
+        self.bins = bins
+        self.batch_size = batch_size
+        self.commits = 0
+        self._deaths = np.zeros(0)
+        self._leaving = np.zeros(0)
+        self._fraction_sum = np.zeros(0)
+        self._fraction_count = np.zeros(0, np.int64)
+        self._histogram = np.zeros((0, bins + 1), np.int64)
+        self._samples = []  # pending commits as [[ts, lines], ...]
+        self._curves = []   # pending commits as daily fraction curves
+        self._pending = 0
+
+    def add(self, values):
+        """Add one commit's survival.json value (samples or a fraction curve)."""
+        if not isinstance(values, list) or not values:
+            return
+        if isinstance(values[0], list):
+            if values[0][1] <= 0:
+                return
+            self._samples.append(values)
+        elif isinstance(values[0], (int, float)):
+            self._curves.append(values)
+        else:
+            return
+        self.commits += 1
+        self._pending += len(values)
+        if self._pending >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if self._samples:
+            self._fold_samples(self._samples)
+        if self._curves:
+            self._fold_curves(self._curves)
+        self._samples, self._curves, self._pending = [], [], 0
+
+    def _grow(self, length):
+        if length <= len(self._deaths):
+            return
+        length = max(length, 2 * len(self._deaths))
+        pad = length - len(self._deaths)
+        self._deaths = np.concatenate([self._deaths, np.zeros(pad)])
+        self._leaving = np.concatenate([self._leaving, np.zeros(pad)])
+        self._fraction_sum = np.concatenate([self._fraction_sum, np.zeros(pad)])
+        self._fraction_count = np.concatenate([self._fraction_count, np.zeros(pad, np.int64)])
+        self._histogram = np.concatenate(
+            [self._histogram, np.zeros((pad, self.bins + 1), np.int64)])
+
+    def _add_events(self, duration, weight, observed):
+        bins = (duration // self.resolution).astype(np.int64)
+        self._grow(bins.max(initial=-1) + 1)
+        binned = np.bincount(bins, weights=weight, minlength=len(self._leaving))
+        self._leaving += binned
+        if observed:
+            self._deaths += binned
+
+    def _add_fractions(self, day, fraction):
+        self._grow(day.max(initial=-1) + 1)
+        n = len(self._fraction_count)
+        self._fraction_sum += np.bincount(day, weights=fraction, minlength=n)
+        self._fraction_count += np.bincount(day, minlength=n)
+        buckets = np.clip(np.rint(fraction * self.bins), 0, self.bins).astype(np.int64)
+        cells = np.bincount(day * (self.bins + 1) + buckets, minlength=self._histogram.size)
+        self._histogram += cells.reshape(self._histogram.shape)
+
+    @staticmethod
+    def _layout(lengths):
+        """First and last flat index of each commit in a concatenated batch."""
+        lengths = np.asarray(lengths, np.int64)
+        starts = np.cumsum(lengths) - lengths
+        return lengths, starts, starts + lengths - 1
+
+    def _fold_samples(self, commits):
+        lengths, starts, ends = self._layout([len(c) for c in commits])
+        flat = np.array(list(chain.from_iterable(commits)), float).reshape(-1, 2)
+        ts, lines = flat[:, 0], flat[:, 1]
+        t0 = np.repeat(ts[starts], lengths)
+        n0 = np.repeat(lines[starts], lengths)
+
+        # Deaths are drops from the commit's previous sample. Lines gained later
+        # (e.g. a revert) count as born with the rest, so births always equal
+        # deaths plus censored lines
+        age = (ts - t0) / 86400
+        drop = np.zeros(len(ts))
+        drop[1:] = lines[:-1] - lines[1:]
+        drop[starts] = 0
+        died = drop > 0
+        self._add_events(age[died], drop[died], observed=True)
+        alive = ends[lines[ends] > 0]
+        self._add_events(age[alive], lines[alive], observed=False)
+
+        # Day d shows the last sample taken at or before t0 + d days
+        first_day = -((t0 - ts) // 86400)
+        next_day = np.empty_like(first_day)
+        next_day[:-1] = first_day[1:]
+        next_day[ends] = (ts[ends] - t0[ends]) // 86400 + 1
+        days = np.clip(next_day - first_day, 0, None).astype(np.int64)
+        offsets = np.repeat(np.cumsum(days) - days, days)
+        day = np.repeat(first_day.astype(np.int64), days) + np.arange(days.sum()) - offsets
+        self._add_fractions(day, np.repeat(lines / n0, days))
+
+    def _fold_curves(self, curves):
+        lengths, starts, ends = self._layout([len(c) for c in curves])
+        fraction = np.fromiter(chain.from_iterable(curves), float, int(lengths.sum()))
+        day = np.arange(len(fraction)) - np.repeat(starts, lengths)
+
+        # A curve starts at weight 1: drops are deaths, the last value is censored
+        drop = np.zeros(len(fraction))
+        drop[1:] = fraction[:-1] - fraction[1:]
+        drop[starts] = 0
+        died = drop > 0
+        self._add_events(day[died].astype(float), drop[died], observed=True)
+        alive = ends[fraction[ends] > 0]
+        self._add_events(day[alive].astype(float), fraction[alive], observed=False)
+        self._add_fractions(day, fraction)
+
+    def kaplan_meier(self, alpha=0.05):
+        """Weighted Kaplan-Meier estimate with (1 - alpha) Greenwood log-log bands.
+
+        Returns a Survival step function over the day bins, starting at
+        time 0 with survival 1.
+        """
+        self._flush()
+        n = int(np.flatnonzero(self._leaving)[-1]) + 1 if self._leaving.any() else 0
+        times = np.arange(n) * float(self.resolution)
+        return _estimate(times, self._deaths[:n], self._leaving[:n], alpha)
+
+    def _days(self):
+        self._flush()
+        return int(np.flatnonzero(self._fraction_count)[-1]) + 1 if self._fraction_count.any() else 0
+
+    def mean(self):
+        """Mean fraction surviving per day over the commits still observed that day."""
+        n = self._days()
+        return self._fraction_sum[:n] / self._fraction_count[:n]
+
+    def percentile(self, q):
+        """Approximate q-th percentile (0-100) of the fraction surviving per day.
+
+        Interpolates linearly between ranks like np.percentile; values are
+        exact to within half a histogram bin.
+        """
+        n = self._days()
+        cumulative = self._histogram[:n].cumsum(axis=1)
+        position = q / 100 * (self._fraction_count[:n] - 1)
+        below, above = np.floor(position), np.ceil(position)
+
+        def value_at(rank):
+            return (cumulative <= rank[:, None]).sum(axis=1) / self.bins
+
+        low = value_at(below)
+        return low + (value_at(above) - low) * (position - below)
+
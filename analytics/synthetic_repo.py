@@ -0,0 +1,122 @@
+"""
+Generate synthetic git repos for benchmarking the analytics pipeline.
+
+History is streamed straight into `git fast-import`, so repos with a million
+commits build in minutes without a working tree. Output is deterministic for
+a given seed: the same parameters always produce the same commit hashes.
+
+Usage:
+  python3 -m analytics.synthetic_repo /tmp/synth --commits 100000 --files 2000 \\
+      --tags 50 --binary-ratio 0.1
+"""
+
+import argparse
+import random
+import subprocess
+from pathlib import Path
+
+TEXT_EXTS = ['.py', '.sh', '.c', '.h', '.md', '.tex', '.js', '.ts', '.json', '.ps1']
+BINARY_EXTS = ['.png', '.pdf', '.bin', '.zip']
+AUTHORS = [('Ada Example', 'ada@example.com'), ('Ben Example', 'ben@example.com'),
+           ('Cy Example', 'cy@example.com'), ('Dee | Pipe', 'dee@example.com')]
+START_TIME = 1767225600  # 2026-01-01T00:00:00Z
+
+
+def file_paths(files, binary_ratio, rng):
+    """Spread files over a shallow directory tree, binary_ratio of them binary."""
+    n_binary = round(files * binary_ratio)
+    paths = []
+    for i in range(files):
+        ext = rng.choice(BINARY_EXTS if i < n_binary else TEXT_EXTS)
+        paths.append(f'd{i % 16}/sub{i % 7}/file{i}{ext}')
+    rng.shuffle(paths)
+    return paths
+
+
+def _data(out, payload):
+    out.write(b'data %d\n' % len(payload))
+    out.write(payload)
+    out.write(b'\n')
+
+
+def _content(path, commit, rng):
+    if Path(path).suffix in BINARY_EXTS:
+        return b'\0' + rng.randbytes(rng.randint(256, 4096))
+    lines = rng.randint(1, 60)
+    return b''.join(b'line %d of %s at commit %d\n' % (j, path.encode(), commit)
+                    for j in range(lines))
+
+
+def write_stream(out, commits, files, tags, binary_ratio, seed, span_days):
+    """Write a fast-import stream for the described history to out (binary)."""
+    rng = random.Random(seed)
+    paths = file_paths(files, binary_ratio, rng)
+    tag_every = max(commits // tags, 1) if tags else 0
+    step = max(span_days * 86400 // max(commits, 1), 1)
+    created = 0
+    n_tags = 0
+
+    for c in range(1, commits + 1):
+        name, email = AUTHORS[c % len(AUTHORS)]
+        when = START_TIME + c * step
+        out.write(b'commit refs/heads/main\nmark :%d\n' % c)
+        out.write(b'author %s <%s> %d +0000\n' % (name.encode(), email.encode(), when))
+        out.write(b'committer %s <%s> %d +0000\n' % (name.encode(), email.encode(), when))
+        _data(out, b'Synthetic commit %d' % c)
+        if c > 1:
+            out.write(b'from :%d\n' % (c - 1))
+
+        # Add the next unseen file until all exist, then modify or delete
+        touched = {paths[created]} if created < len(paths) else set()
+        created += len(touched)
+        while len(touched) < rng.randint(1, 3):
+            touched.add(paths[rng.randrange(created)])
+        for path in sorted(touched):
+            if created == len(paths) and rng.random() < 0.01:
+                out.write(b'D %s\n' % path.encode())
+                continue
+            out.write(b'M 100644 inline %s\n' % path.encode())
+            _data(out, _content(path, c, rng))
+        out.write(b'\n')
+
+        if tag_every and c % tag_every == 0 and n_tags < tags:
+            n_tags += 1
+            out.write(b'reset refs/tags/v%d.0.0\nfrom :%d\n\n' % (n_tags, c))
+
+
+def make_repo(path, commits=1000, files=100, tags=10, binary_ratio=0.1, seed=0, span_days=365):
+    """Create a non-bare repo at path with the given synthetic history."""
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    subprocess.run(['git', 'init', '-q', '-b', 'main', str(path)], check=True)
+    proc = subprocess.Popen(['git', '-C', str(path), 'fast-import', '--quiet'],
+                            stdin=subprocess.PIPE)
+    try:
+        write_stream(proc.stdin, commits, files, tags, binary_ratio, seed, span_days)
+    finally:
+        proc.stdin.close()
+    if proc.wait() != 0:
+        raise RuntimeError(f'git fast-import failed for {path}')
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate a synthetic git repo.')
+    parser.add_argument('path', help='directory to create the repo in')
+    parser.add_argument('--commits', type=int, default=1000)
+    parser.add_argument('--files', type=int, default=100)
+    parser.add_argument('--tags', type=int, default=10)
+    parser.add_argument('--binary-ratio', type=float, default=0.1,
+                        help='fraction of files that are binary (default: 0.1)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--span-days', type=int, default=365,
+                        help='calendar days the history is spread over (default: 365)')
+    args = parser.parse_args(argv)
+
+    make_repo(args.path, args.commits, args.files, args.tags, args.binary_ratio,
+              args.seed, args.span_days)
+    print(f'Created {args.path}: {args.commits} commits, {args.files} files, {args.tags} tags')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+"""
+Generate git-of-theseus plots for Security Toolkit.
+Produces cohort stack plots, survival curves, and extension breakdown.
+
+Inputs are the JSON files in visualizations/theseus/, written by
+`python3 -m analytics.code_age` (or by an external git-of-theseus run).
+"""
+
+import argparse
+import heapq
+import numpy as np
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from . import tracing
+from .code_age import THESEUS_DIR
+from .downsample import stack_indices
+from .figures import (PROFILES, date_axis, get_profile, max_points, pyplot, render_figure,
+                      save_figure, set_profile, size_report, update_manifest)
+from .json_stream import JSONStream
+from .survival import SurvivalAccumulator
+from .tracing import span
+
+@contextmanager
+def open_json(filename):
+    """A JSONStream over a theseus input file (see json_stream.py)."""
+    with open(THESEUS_DIR / filename) as f:
+        yield JSONStream(f)
+
+
+# ============================================================================
+# Helper: stream theseus new-format JSON (keys: y, ts, labels)
+# ============================================================================
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def date_num(timestamp):
+    """ISO timestamp as matplotlib date number (days since 1970, naive = UTC)."""
+    dt = datetime.fromisoformat(timestamp)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - EPOCH).total_seconds() / 86400
+
+
+def load_series(filename, top=None):
+    """Parse git-of-theseus v0.3+ JSON: {y: [[...]], ts: [...], labels: [...]}.
+
+    The y rows are streamed. With top=n only the n labels with the largest
+    peak LOC are kept (largest first for stackplot), so memory is n rows
+    rather than one per label. The series is then cut to the profile's
+    max_points() shared samples, keeping the peaks of the stacked total.
+    """
+    rows, ts_strs, labels = [], [], []
+    with open_json(filename) as stream:
+        for key in stream.items():
+            if key == 'y':
+                for i, _ in enumerate(stream.array()):
+                    row = np.asarray(stream.value(), float)
+                    entry = (row.max(initial=0), -i, row)
+                    if top is None:
+                        rows.append(entry)
+                    elif len(rows) < top:
+                        heapq.heappush(rows, entry)
+                    elif entry[:2] > rows[0][:2]:
+                        heapq.heapreplace(rows, entry)
+            elif key == 'ts':
+                ts_strs = stream.value()
+            elif key == 'labels':
+                labels = stream.value()
+            else:
+                stream.value()
+    if top is not None:
+        rows.sort(key=lambda entry: entry[:2], reverse=True)
+    dates = [date_num(t) for t in ts_strs]
+    y = np.array([row for _, _, row in rows]).reshape(len(rows), len(dates))
+    keep = stack_indices(y, max_points())
+    return [dates[i] for i in keep], [labels[-neg_index] for _, neg_index, _ in rows], y[:, keep]
+
+
+# ============================================================================
+# Cohort Stack Plot (code age analysis)
+# ============================================================================
+def cohorts_data():
+    return load_series('cohorts.json')
+
+
+def draw_cohorts(inputs):
+    print('Theseus Chart 1: Code cohort analysis...')
+    plt = pyplot()
+    dates, labels, y = inputs
+
+    fig, ax = plt.subplots(figsize=(8, 4))
+    ax.stackplot(dates, y, labels=labels, alpha=0.85)
+    ax.xaxis_date()
+    date_axis(ax.xaxis)
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Lines of Code')
+    ax.set_title('Security Toolkit: Code Age Cohorts')
+    ax.legend(loc='upper left', fontsize=7, title='Written in', title_fontsize=8)
+    ax.grid(True, alpha=0.3, axis='y')
+    fig.autofmt_xdate()
+    save_figure(fig, 'theseus_cohorts')
+    plt.close()
+
+
+# ============================================================================
+# Survival Plot (Kaplan-Meier)
+# ============================================================================
+def survival_data():
+    """Kaplan-Meier curve with 95% band, plus the per-commit mean and quartiles.
+
+    survival.json keys are commit hashes; values are either daily fractions
+    surviving or git-of-theseus/code_age [[ts, lines], ...] samples. Commits
+    are streamed into running aggregates, so memory follows the length of
+    the longest curve rather than the size of the file.
+    """
+    summary = SurvivalAccumulator()
+    with open_json('survival.json') as stream:
+        for _ in stream.items():
+            summary.add(stream.value())
+    if not summary.commits:
+        return {}
+    curve = summary.kaplan_meier()
+    mean = summary.mean()
+    return {'days': curve.time, 'survival': curve.survival,
+            'lower': curve.lower, 'upper': curve.upper,
+            'mean_days': np.arange(len(mean)), 'mean': mean,
+            'p25': summary.percentile(25), 'p75': summary.percentile(75)}
+
+
+def draw_survival(curves):
+    print('Theseus Chart 2: Code survival curve...')
+    plt = pyplot()
+    fig, ax = plt.subplots(figsize=(8, 4))
+
+    if curves:
+        days, survival = curves['days'], curves['survival']
+        ax.step(days, survival, where='post', color='#1f77b4', linewidth=2,
+                label='Kaplan-Meier estimate')
+        ax.fill_between(days, curves['lower'], curves['upper'], step='post', alpha=0.2,
+                        color='#1f77b4', label='95% confidence band')
+        ax.plot(curves['mean_days'], curves['mean'], color='#7f7f7f', linewidth=1,
+                linestyle='--', label='Per-commit mean')
+        ax.fill_between(curves['mean_days'], curves['p25'], curves['p75'], alpha=0.1,
+                        color='#7f7f7f', label='Per-commit 25th-75th percentile')
+
+    ax.set_xlabel('Days Since Written')
+    ax.set_ylabel('Fraction of Code Surviving')
+    ax.set_title('Security Toolkit: Code Survival Curve (Kaplan-Meier)')
+    ax.set_ylim(0, 1.05)
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=8)
+    save_figure(fig, 'theseus_survival')
+    plt.close()
+
+
+# ============================================================================
+# Extension Stack Plot (language evolution)
+# ============================================================================
+def extensions_data():
+    dates, labels, y = load_series('exts.json', top=8)
+    return dates, [label if label else '(no ext)' for label in labels], y
+
+
+def draw_extensions(inputs):
+    print('Theseus Chart 3: Language/extension evolution...')
+    plt = pyplot()
+    dates, labels, y = inputs
+
+    fig, ax = plt.subplots(figsize=(8, 4))
+    ax.stackplot(dates, y, labels=labels, alpha=0.85)
+    ax.xaxis_date()
+    date_axis(ax.xaxis)
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Lines of Code')
+    ax.set_title('Security Toolkit: Code by File Extension Over Time')
+    ax.legend(loc='upper left', fontsize=7)
+    ax.grid(True, alpha=0.3, axis='y')
+    fig.autofmt_xdate()
+    save_figure(fig, 'theseus_extensions')
+    plt.close()
+
+
+# ============================================================================
+# Directory Stack Plot
+# ============================================================================
+def directories_data():
+    return load_series('dirs.json', top=8)
+
+
+def draw_directories(inputs):
+    print('Theseus Chart 4: Directory structure evolution...')
+    plt = pyplot()
+    dates, labels, y = inputs
+
+    fig, ax = plt.subplots(figsize=(8, 4))
+    ax.stackplot(dates, y, labels=labels, alpha=0.85)
+    ax.xaxis_date()
+    date_axis(ax.xaxis)
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Lines of Code')
+    ax.set_title('Security Toolkit: Code by Directory Over Time')
+    ax.legend(loc='upper left', fontsize=6, ncol=2)
+    ax.grid(True, alpha=0.3, axis='y')
+    fig.autofmt_xdate()
+    save_figure(fig, 'theseus_directories')
+    plt.close()
+
+
+# Figure name -> (load and aggregate inputs, draw from those inputs)
+THESEUS_CHARTS = {
+    'theseus_cohorts':     (cohorts_data, draw_cohorts),
+    'theseus_survival':    (survival_data, draw_survival),
+    'theseus_extensions':  (extensions_data, draw_extensions),
+    'theseus_directories': (directories_data, draw_directories),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate git-of-theseus plots.')
+    parser.add_argument('--profile', choices=list(PROFILES), default=get_profile(),
+                        help='output formats: default (PNG+PDF+TikZ), draft (low-dpi PNG), '
+                             'paper (PDF+TikZ), slides (PNG sized for the slide deck)')
+    parser.add_argument('--force', action='store_true',
+                        help='re-render figures even if their inputs are unchanged')
+    parser.add_argument('--trace', metavar='PATH', default=None,
+                        help='append Chrome trace events to PATH (same as WHITEPAPER_TRACE=PATH)')
+    args = parser.parse_args(argv)
+    set_profile(args.profile)
+    if args.trace:
+        tracing.enable(args.trace)
+
+    results = {}
+    for name, (prepare, draw) in THESEUS_CHARTS.items():
+        with span(f'prepare {name}'):
+            inputs = prepare()
+        results[name] = render_figure(name, draw, inputs, args.force)
+    update_manifest({name: result for name, result in results.items() if result})
+    size_report(THESEUS_CHARTS)
+
+    print('\n=== Theseus charts done! ===')
+
+
+if __name__ == '__main__':
+    main()
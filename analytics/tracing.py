@@ -0,0 +1,206 @@
+"""
+Optional stage and subprocess tracing for the generators and build.sh.
+
+Set WHITEPAPER_TRACE=trace.json (or pass --trace trace.json to a generator)
+to record spans as Chrome trace events, viewable in chrome://tracing or
+https://ui.perfetto.dev. The file uses the appendable JSON array form
+("[" then one event per line, each followed by a comma), so every process
+appends its own events when it exits: build.sh steps, the generators they
+start and the generators' worker processes all land in one trace.
+
+Every span records wall time and the CPU time of the thread that ran it.
+Stage and repo spans also record the tracemalloc peak reached while they
+were open, unless WHITEPAPER_TRACE_MEMORY=0 (tracemalloc slows Python-heavy
+stages several-fold). Subprocess spans are counted per repo, and the totals
+are written as a final "subprocess counts" event.
+
+With tracing off, span() does nothing beyond one check.
+
+build.sh wraps each step with:
+  python3 -m analytics.tracing run STEP_NAME -- command [args...]
+"""
+
+import atexit
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+_path = None
+_trace_memory = os.environ.get('WHITEPAPER_TRACE_MEMORY', '1') != '0'
+_events = []
+_lock = threading.Lock()
+_open_peaks = {}  # token -> peak bytes, for open spans tracking tracemalloc peaks
+_subprocesses = Counter()
+_local = threading.local()
+
+
+def now():
+    """Trace timestamp in microseconds (wall clock, shared across processes)."""
+    return time.time_ns() // 1000
+
+
+def enabled():
+    return _path is not None
+
+
+def enable(path):
+    """Start recording to path; child processes inherit it via WHITEPAPER_TRACE."""
+    global _path
+    first = _path is None
+    _path = str(path)
+    os.environ['WHITEPAPER_TRACE'] = _path
+    if first:
+        if _trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _name_process(os.path.basename(sys.argv[0]) or 'python')
+        atexit.register(flush, final=True)
+
+
+def _name_process(name, pid=None):
+    _events.append({'name': 'process_name', 'ph': 'M', 'pid': pid or os.getpid(),
+                    'args': {'name': name}})
+
+
+def _after_fork():
+    """Drop events inherited from the parent; the child records its own."""
+    global _lock
+    _lock = threading.Lock()
+    del _events[:]
+    _open_peaks.clear()
+    _subprocesses.clear()
+    if _path is not None:
+        _name_process(f'{os.path.basename(sys.argv[0])} worker')
+
+
+os.register_at_fork(after_in_child=_after_fork)
+
+
+def _fold_peak():
+    """Credit the tracemalloc peak so far to every open span (hold _lock)."""
+    peak = tracemalloc.get_traced_memory()[1]
+    for token, seen in _open_peaks.items():
+        _open_peaks[token] = max(seen, peak)
+    tracemalloc.reset_peak()
+
+
+def _command_name(cmd):
+    """Short span name for a command: 'git log', 'git cat-file', 'gh', ..."""
+    if len(cmd) > 3 and cmd[0] == 'git' and cmd[1] == '-C':
+        return f'git {cmd[3]}'
+    return os.path.basename(str(cmd[0]))
+
+
+@contextmanager
+def span(name, cat='stage', **args):
+    """Record the enclosed block as a complete trace event.
+
+    cat='repo' marks per-repo work: subprocess spans inside it are counted
+    against that repo. cat='subprocess' spans are counted, not memory-tracked.
+    """
+    if _path is None:
+        yield
+        return
+
+    track_memory = _trace_memory and tracemalloc.is_tracing() and cat != 'subprocess'
+    if track_memory:
+        token = object()
+        with _lock:
+            _fold_peak()
+            _open_peaks[token] = 0
+    if cat == 'repo':
+        outer_repo = getattr(_local, 'repo', None)
+        _local.repo = name
+        before = _subprocesses[name]
+    repo = getattr(_local, 'repo', None)
+    if cat == 'subprocess' and repo is not None:
+        args['repo'] = repo
+
+    start = now()
+    cpu = time.thread_time()
+    try:
+        yield
+    finally:
+        args['cpu_ms'] = round((time.thread_time() - cpu) * 1000, 3)
+        if track_memory:
+            with _lock:
+                _fold_peak()
+                args['peak_bytes'] = _open_peaks.pop(token)
+        if cat == 'repo':
+            _local.repo = outer_repo
+            args['subprocesses'] = _subprocesses[name] - before
+        elif cat == 'subprocess':
+            with _lock:
+                _subprocesses[repo] += 1
+        event = {'name': name, 'cat': cat, 'ph': 'X', 'ts': start, 'dur': now() - start,
+                 'pid': os.getpid(), 'tid': threading.get_native_id(), 'args': args}
+        with _lock:
+            _events.append(event)
+
+
+def subprocess_span(cmd):
+    """span() for running cmd, named after the command."""
+    return span(_command_name(cmd), cat='subprocess', cmd=' '.join(map(str, cmd[:6])))
+
+
+def record(name, start, cat='stage', **args):
+    """Record a span that began at start (from now()) and ends now."""
+    if _path is None:
+        return
+    with _lock:
+        _events.append({'name': name, 'cat': cat, 'ph': 'X', 'ts': start, 'dur': now() - start,
+                        'pid': os.getpid(), 'tid': threading.get_native_id(), 'args': args})
+
+
+def flush(final=False):
+    """Append recorded events to the trace file."""
+    if _path is None:
+        return
+    with _lock:
+        events = list(_events)
+        del _events[:]
+        if final and _subprocesses:
+            events.append({'name': 'subprocess counts', 'cat': 'summary', 'ph': 'i', 's': 'p',
+                           'ts': now(), 'pid': os.getpid(), 'tid': threading.get_native_id(),
+                           'args': {repo or '(no repo)': n for repo, n in _subprocesses.items()}})
+    if not events:
+        return
+    with open(_path, 'a') as f:
+        if f.tell() == 0:
+            f.write('[\n')
+        f.write(''.join(json.dumps(e) + ',\n' for e in events))
+
+
+if os.environ.get('WHITEPAPER_TRACE'):
+    enable(os.environ['WHITEPAPER_TRACE'])
+
+
+def _run_step(name, cmd):
+    """Run one build.sh step as a span on the calling shell's track."""
+    from resource import RUSAGE_CHILDREN, getrusage
+    before = getrusage(RUSAGE_CHILDREN)
+    start = now()
+    returncode = subprocess.call(cmd)
+    after = getrusage(RUSAGE_CHILDREN)
+    shell = os.getppid()
+    _events[:] = []
+    _name_process('build.sh', shell)
+    _events.append({
+        'name': name, 'cat': 'build', 'ph': 'X', 'ts': start, 'dur': now() - start,
+        'pid': shell, 'tid': shell,
+        'args': {'cmd': ' '.join(cmd[:6]), 'returncode': returncode,
+                 'child_cpu_ms': round((after.ru_utime - before.ru_utime
+                                        + after.ru_stime - before.ru_stime) * 1000, 3)},
+    })
+    return returncode
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 5 or sys.argv[1] != 'run' or sys.argv[3] != '--':
+        sys.exit('usage: python3 -m analytics.tracing run STEP_NAME -- command [args...]')
+    sys.exit(_run_step(sys.argv[2], sys.argv[4:]))
@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""Benchmark the analytics pipeline on synthetic repos (wrapper for python3 -m analytics.benchmark)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from analytics.benchmark import main  # noqa: E402
+
+if __name__ == '__main__':
+    main()
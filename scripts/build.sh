@@ -9,6 +9,7 @@
 #   - NIST SP 800-53 CM-3: Reproducible build from version-controlled source
 #
 # Usage: ./scripts/build.sh
+#        WHITEPAPER_TRACE=trace.json ./scripts/build.sh   (Chrome trace of all steps)
 #
 
 set -eu
@@ -23,46 +24,57 @@ if [ ! -f "$TEX_FILE" ]; then
     exit 1
 fi
 
+# Run a build step; recorded as a trace span when WHITEPAPER_TRACE is set
+step() {
+    local name="$1"
+    shift
+    if [ -n "${WHITEPAPER_TRACE:-}" ] && command -v python3 &> /dev/null; then
+        PYTHONPATH="$REPO_DIR${PYTHONPATH:+:$PYTHONPATH}" python3 -m analytics.tracing run "$name" -- "$@"
+    else
+        "$@"
+    fi
+}
+
 echo "Building $BASE_NAME.pdf ..."
 
 # Step 0: Generate metrics.tex from live git/GitHub data
 if command -v python3 &> /dev/null && [ -f "$SCRIPT_DIR/generate_metrics.py" ]; then
     echo "  [0/4] generate_metrics.py (auto-update paper numbers)"
-    python3 "$SCRIPT_DIR/generate_metrics.py" > /dev/null 2>&1 || \
+    step generate_metrics python3 "$SCRIPT_DIR/generate_metrics.py" > /dev/null 2>&1 || \
         echo "  WARNING: metrics generation failed, using stale metrics.tex"
 fi
 
 # Step 1: Initial compile (generates .aux for bibtex)
 echo "  [1/4] pdflatex (initial)"
-pdflatex -interaction=nonstopmode -output-directory="$REPO_DIR" "$TEX_FILE" > /dev/null 2>&1
+step "pdflatex (initial)" pdflatex -interaction=nonstopmode -output-directory="$REPO_DIR" "$TEX_FILE" > /dev/null 2>&1
 
 # Step 2: Process bibliography
 echo "  [2/4] bibtex"
-(cd "$REPO_DIR" && bibtex "$BASE_NAME") > /dev/null 2>&1
+(cd "$REPO_DIR" && step bibtex bibtex "$BASE_NAME") > /dev/null 2>&1
 
 # Step 3: Second compile (incorporates bibliography)
 echo "  [3/4] pdflatex (bibliography)"
-pdflatex -interaction=nonstopmode -output-directory="$REPO_DIR" "$TEX_FILE" > /dev/null 2>&1
+step "pdflatex (bibliography)" pdflatex -interaction=nonstopmode -output-directory="$REPO_DIR" "$TEX_FILE" > /dev/null 2>&1
 
 # Step 4: Third compile (resolves all cross-references)
 echo "  [4/4] pdflatex (cross-references)"
-pdflatex -interaction=nonstopmode -output-directory="$REPO_DIR" "$TEX_FILE" > /dev/null 2>&1
+step "pdflatex (cross-references)" pdflatex -interaction=nonstopmode -output-directory="$REPO_DIR" "$TEX_FILE" > /dev/null 2>&1
 
 # Generate reviewable outputs (Markdown + HTML)
 if command -v pandoc &> /dev/null; then
     echo "  [5/6] pandoc (markdown for review)"
-    pandoc "$TEX_FILE" -f latex -t gfm --wrap=auto \
+    step "pandoc (markdown)" pandoc "$TEX_FILE" -f latex -t gfm --wrap=auto \
         --citeproc --bibliography="$REPO_DIR/references.bib" \
         -o "$REPO_DIR/${BASE_NAME}-review.md" 2>/dev/null || \
-    pandoc "$TEX_FILE" -f latex -t gfm --wrap=auto \
+    step "pandoc (markdown)" pandoc "$TEX_FILE" -f latex -t gfm --wrap=auto \
         -o "$REPO_DIR/${BASE_NAME}-review.md" 2>/dev/null
 
     echo "  [6/6] pandoc (HTML for browser review)"
-    pandoc "$TEX_FILE" -f latex -t html5 --standalone --mathjax \
+    step "pandoc (html)" pandoc "$TEX_FILE" -f latex -t html5 --standalone --mathjax \
         --metadata title="Git and AI Coding Agents for Government Compliance: A Human-in-the-Loop Methodology" \
         --citeproc --bibliography="$REPO_DIR/references.bib" \
         -o "$REPO_DIR/${BASE_NAME}-review.html" 2>/dev/null || \
-    pandoc "$TEX_FILE" -f latex -t html5 --standalone --mathjax \
+    step "pandoc (html)" pandoc "$TEX_FILE" -f latex -t html5 --standalone --mathjax \
         -o "$REPO_DIR/${BASE_NAME}-review.html" 2>/dev/null
 fi
 
@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""Serve GitHub issue counts from a JSON fixture (wrapper for python3 -m analytics.github_fixture_server)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from analytics.github_fixture_server import main  # noqa: E402
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""Generate a synthetic git repo (wrapper for python3 -m analytics.synthetic_repo)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from analytics.synthetic_repo import main  # noqa: E402
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+import subprocess
+
+import pytest
+
+from analytics import git_history
+
+
+def run_git(path, *args, date='2026-01-01T00:00:00+00:00', author='A'):
+    """git -C path <args> with a fixed identity and dates and no user config."""
+    env = {'GIT_AUTHOR_NAME': author, 'GIT_AUTHOR_EMAIL': 'a@example.com',
+           'GIT_COMMITTER_NAME': 'A', 'GIT_COMMITTER_EMAIL': 'a@example.com',
+           'GIT_AUTHOR_DATE': date, 'GIT_COMMITTER_DATE': date,
+           'GIT_CONFIG_NOSYSTEM': '1', 'HOME': str(path), 'PATH': '/usr/bin:/bin:/usr/local/bin'}
+    return subprocess.run(['git', '-C', str(path), *args], check=True, capture_output=True,
+                          text=True, env=env).stdout.strip()
+
+
+@pytest.fixture
+def git():
+    return run_git
+
+
+@pytest.fixture(autouse=True)
+def history_cache(tmp_path, monkeypatch):
+    """Keep the history cache of every test in its own temporary directory."""
+    monkeypatch.setattr(git_history, 'HISTORY_DIR', tmp_path / 'history')
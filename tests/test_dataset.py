@@ -0,0 +1,26 @@
+import pytest
+
+from analytics import dataset
+
+
+@pytest.fixture
+def repos(tmp_path, git):
+    empty, full = tmp_path / 'empty', tmp_path / 'full'
+    for path in (empty, full):
+        path.mkdir()
+        git(path, 'init', '-q')
+    (full / 'a.py').write_text('print(1)\n')
+    git(full, 'add', 'a.py')
+    git(full, 'commit', '-q', '-m', 'first')
+    return {'Empty': str(empty), 'Full': str(full)}
+
+
+def test_empty_repo_concatenates_with_non_empty(repos):
+    extracted = {name: dataset.extract_repo(name, path) for name, path in repos.items()}
+    commits = dataset.concat_frames([c for c, _, _ in extracted.values()], ['author', 'repo'])
+    changes = dataset.concat_frames([c for _, c, _ in extracted.values()], ['file', 'repo'])
+
+    assert len(commits) == 1 and len(changes) == 1
+    assert list(commits['author']) == ['A']
+    assert list(changes['file']) == ['a.py']
+    assert set(commits['repo'].cat.categories) == {'Empty', 'Full'}
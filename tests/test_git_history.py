@@ -0,0 +1,98 @@
+import pytest
+
+from analytics.git_history import Commit, iter_log, load_history
+
+
+@pytest.fixture
+def repo(tmp_path, git):
+    path = tmp_path / 'repo'
+    path.mkdir()
+    git(path, 'init', '-q', '-b', 'main')
+    for i in range(3):
+        commit(git, path, i)
+    return path
+
+
+def commit(git, path, i):
+    (path / f'f{i}.txt').write_text(f'{i}\n' * (i + 1))
+    git(path, 'add', '.')
+    git(path, 'commit', '-q', '-m', f'c{i}', date=f'2026-01-{i + 1:02d}T00:00:00+00:00')
+
+
+def rows(history):
+    return len(history.commits), len(history.changes)
+
+
+def test_cache_source_follows_the_refs(repo, git):
+    first = load_history(repo)
+    assert first.source == 'full' and rows(first) == (3, 3)
+
+    again = load_history(repo)
+    assert again.source == 'cached' and rows(again) == (3, 3)
+
+    commit(git, repo, 3)
+    grown = load_history(repo)
+    assert grown.source == 'incremental' and rows(grown) == (4, 4)
+
+    git(repo, 'tag', 'old', 'HEAD~2')
+    tagged = load_history(repo)
+    assert tagged.source == 'incremental' and rows(tagged) == (4, 4)
+    assert tagged.fingerprint != grown.fingerprint
+
+    git(repo, 'tag', '-d', 'old')
+    git(repo, 'reset', '-q', '--hard', 'HEAD~2')
+    git(repo, 'reflog', 'expire', '--expire=now', '--all')
+    git(repo, 'gc', '-q', '--prune=now')
+    rewritten = load_history(repo)
+    assert rewritten.source == 'full' and rows(rewritten) == (2, 2)
+    assert load_history(repo).source == 'cached'
+
+
+def day(n):
+    return f'2026-02-{n:02d}T00:00:00+00:00'
+
+
+def test_iter_log_records(tmp_path, git):
+    path = tmp_path / 'log'
+    path.mkdir()
+    git(path, 'init', '-q', '-b', 'main')
+    (path / 'a.txt').write_text('1\n2\n')
+    git(path, 'add', '.')
+    git(path, 'commit', '-q', '-m', 'root | commit', date=day(1), author='Pipe | Name')
+    git(path, 'mv', 'a.txt', 'b.txt')
+    git(path, 'commit', '-q', '-m', 'rename a to b', date=day(2))
+    git(path, 'checkout', '-q', '-b', 'side')
+    (path / 'c.bin').write_bytes(b'\0\1\2binary')
+    git(path, 'add', '.')
+    git(path, 'commit', '-q', '-m', 'add binary', date=day(3))
+    git(path, 'checkout', '-q', 'main')
+    (path / 'b.txt').write_text('1\n2\n3\n4\n5\n')
+    git(path, 'commit', '-q', '-am', 'grow b', date=day(4))
+    git(path, 'merge', '-q', '--no-ff', '-m', 'Merge side', 'side', date=day(5))
+
+    records = list(iter_log(path))
+    commits = [r for r in records if type(r) is Commit]
+    assert [(c.message, c.author, c.merge) for c in commits] == [
+        ('Merge side', 'A', True),
+        ('grow b', 'A', False),
+        ('add binary', 'A', False),
+        ('rename a to b', 'A', False),
+        ('root | commit', 'Pipe | Name', False),
+    ]
+    assert [c.time for c in commits] == [1769904000 + 86400 * n for n in (4, 3, 2, 1, 0)]
+    assert commits[0].hash == git(path, 'rev-parse', 'HEAD')
+
+    # Each FileChange follows its Commit; the merge has no numstat rows
+    owner, changes = None, []
+    for record in records:
+        if type(record) is Commit:
+            owner = record
+        else:
+            assert record.hash == owner.hash and record.time == owner.time
+            changes.append((owner.message, record.additions, record.deletions, record.file))
+    assert changes == [
+        ('grow b', 3, 0, 'b.txt'),
+        ('add binary', 0, 0, 'c.bin'),
+        ('rename a to b', 0, 0, 'b.txt'),
+        ('root | commit', 2, 0, 'a.txt'),
+    ]
@@ -0,0 +1,63 @@
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from analytics import github_issues
+from analytics.github_fixture_server import make_handler
+
+COUNTS = {'acme/big': 1234, 'acme/small': 7}
+REPOS = {'Big': 'acme/big', 'Small': 'acme/small', 'Gone': 'acme/gone'}
+
+
+class FixtureServer:
+    """github_fixture_server on an ephemeral port, recording (If-None-Match, status) per request."""
+
+    def __init__(self):
+        self.requests = []
+        requests = self.requests
+
+        class RecordingHandler(make_handler(COUNTS)):
+            def send_response(self, code, message=None):
+                requests.append((self.headers.get('If-None-Match'), code))
+                super().send_response(code, message)
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), RecordingHandler)
+        self.url = f'http://127.0.0.1:{self.httpd.server_address[1]}/graphql'
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    server = FixtureServer()
+    monkeypatch.setenv('GITHUB_TOKEN', 'test-token')
+    monkeypatch.setattr(github_issues, 'CACHE_PATH', tmp_path / 'github_issues.json')
+    monkeypatch.setattr(github_issues, 'GRAPHQL_URL', server.url)
+    yield server
+    server.stop()
+
+
+def test_exact_counts_above_500(server):
+    assert github_issues.fetch_issue_counts(REPOS) == {'Big': 1234, 'Small': 7, 'Gone': 0}
+    assert server.requests == [(None, 200)]
+
+
+def test_second_call_revalidates_with_etag(server):
+    first = github_issues.fetch_issue_counts(REPOS)
+    assert github_issues.fetch_issue_counts(REPOS) == first
+    (etag, status), (sent, revalidated) = server.requests
+    assert etag is None and status == 200
+    assert sent and revalidated == 304
+
+
+def test_connection_failure_falls_back_to_cached_counts(server, capsys):
+    first = github_issues.fetch_issue_counts(REPOS)
+    server.stop()
+    assert github_issues.fetch_issue_counts(REPOS) == first
+    assert 'using cached issue counts' in capsys.readouterr().out
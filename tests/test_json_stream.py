@@ -0,0 +1,46 @@
+import io
+import json
+
+import pytest
+
+from analytics.json_stream import JSONStream
+
+DOC = {
+    'numbers': [0, -1, 123456789012345, 3.14159, -2.5e-10, 1E+300],
+    'strings': ['', 'plain', 'esc\\aped "quotes"\n\ttabs', 'unicode é中 \U0001f600'],
+    'literals': [True, False, None, [True], {'null': None}],
+    'nested': {'a': {'b': [[], {}, [1, [2, [3]]]]}, 'empty': {}},
+    'wide': list(range(500)),
+}
+
+
+def walk(stream, template):
+    """Rebuild a value with items()/array() wherever template has a container."""
+    if isinstance(template, dict):
+        return {key: walk(stream, template[key]) for key in stream.items()}
+    if isinstance(template, list) and template:
+        out = []
+        for _ in stream.array():
+            out.append(walk(stream, template[len(out)]))
+        return out
+    return stream.value()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 7, 64, 1 << 16])
+@pytest.mark.parametrize('indent', [None, 2])
+def test_matches_json_load(chunk_size, indent):
+    text = json.dumps(DOC, indent=indent)
+    expected = json.load(io.StringIO(text))
+    assert walk(JSONStream(io.StringIO(text), chunk_size), expected) == expected
+    assert JSONStream(io.StringIO(text), chunk_size).value() == expected
+
+
+@pytest.mark.parametrize('chunk_size', [1, 4, 16])
+def test_top_level_scalars(chunk_size):
+    for text in ['12345678', '-0.5e3', '"split string"', 'true', 'false', 'null']:
+        assert JSONStream(io.StringIO(text), chunk_size).value() == json.loads(text)
+
+
+def test_truncated_value_raises():
+    with pytest.raises(ValueError):
+        JSONStream(io.StringIO('{"a": [1, 2'), 4).value()
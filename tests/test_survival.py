@@ -0,0 +1,52 @@
+import math
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+
+from analytics.survival import SurvivalAccumulator
+
+DAY = 86400
+
+
+def greenwood_band(s, greenwood, alpha=0.05):
+    """Log-log (1 - alpha) band around s, computed by hand."""
+    z = NormalDist().inv_cdf(1 - alpha / 2)
+    se = math.sqrt(greenwood) / abs(math.log(s))
+    return s ** math.exp(z * se), s ** math.exp(-z * se)
+
+
+@pytest.mark.parametrize('batch_size', [1, 1 << 16])
+def test_samples_death_and_censoring_in_one_bin(batch_size):
+    acc = SurvivalAccumulator(batch_size=batch_size)
+    acc.add([[0, 10], [DAY, 5]])        # 5 die on day 1, 5 censored there
+    acc.add([[0, 5], [DAY, 5]])         # 5 censored on day 1
+    acc.add([[0, 5], [2 * DAY, 5]])     # 5 censored on day 2
+    acc.add([[0, 0], [DAY, 0]])         # never had lines: ignored
+    curve = acc.kaplan_meier()
+
+    assert acc.commits == 3
+    np.testing.assert_allclose(curve.time, [0, 1, 2])
+    np.testing.assert_allclose(curve.survival, [1, 0.75, 0.75])
+    np.testing.assert_allclose(curve.at_risk, [20, 20, 5])
+    lower, upper = greenwood_band(0.75, 5 / (20 * 15))
+    np.testing.assert_allclose(curve.lower, [1, lower, lower])
+    np.testing.assert_allclose(curve.upper, [1, upper, upper])
+    # Day 1 shows A at half its lines; C's last sample before day 1 is day 0
+    np.testing.assert_allclose(acc.mean(), [1, 2.5 / 3, 1])
+
+
+def test_fraction_curves():
+    acc = SurvivalAccumulator()
+    acc.add([1.0, 0.5, 0.5])    # half dies on day 1, half censored on day 2
+    acc.add([1.0, 1.0])         # all censored on day 1
+    curve = acc.kaplan_meier()
+
+    np.testing.assert_allclose(curve.survival, [1, 0.75, 0.75])
+    np.testing.assert_allclose(curve.at_risk, [2, 2, 0.5])
+    lower, upper = greenwood_band(0.75, 0.5 / (2 * 1.5))
+    np.testing.assert_allclose(curve.lower[1:], [lower, lower])
+    np.testing.assert_allclose(curve.upper[1:], [upper, upper])
+    np.testing.assert_allclose(acc.mean(), [1, 0.75, 0.5])
+    np.testing.assert_allclose(acc.percentile(50), [1, 0.75, 0.5])
+    np.testing.assert_allclose(acc.percentile(25), [1, 0.625, 0.5])